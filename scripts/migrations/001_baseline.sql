@@ -58,6 +58,8 @@ CREATE TABLE IF NOT EXISTS market_metadata (
     slug TEXT,
     resolution_source TEXT,
     end_date_utc TIMESTAMPTZ,
+    question TEXT,
+    outcomes_json TEXT,
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
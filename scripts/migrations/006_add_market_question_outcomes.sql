@@ -0,0 +1,9 @@
+-- Cache question/outcomes on market_metadata so the EOD job can resolve runs
+-- without a Gamma round-trip per run. Populated on upsert when a market is
+-- selected; outcomes_json is the raw Gamma outcomes JSON string (e.g. '["Up","Down"]').
+
+ALTER TABLE market_metadata
+ADD COLUMN IF NOT EXISTS question TEXT;
+
+ALTER TABLE market_metadata
+ADD COLUMN IF NOT EXISTS outcomes_json TEXT;
@@ -14,6 +14,13 @@ from typing import Any
 # Add src to path so app is importable
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+try:  # Faster event loop for the CLOB/DB round-trips
+    import uvloop
+
+    uvloop.install()
+except ImportError:  # pragma: no cover - uvloop unavailable (e.g. Windows dev box)
+    pass
+
 from app.analytics.slippage_audit import slippage_bps, vwap_for_size_usd
 from app.db.session import acquire, init_pool
 from app.polymarket.models import OrderBook, OrderBookLevel
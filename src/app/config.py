@@ -100,6 +100,13 @@ class Settings(BaseSettings):
         description="Optional slug to link /signal to a specific hourly market when active (e.g. bitcoin-up-or-down-january-31-5pm-et).",
     )
 
+    # Optional: Gamma tag_id to pre-filter /markets to BTC server-side (smaller pages,
+    # less client-side slug filtering). Find it on gamma-api.polymarket.com/tags.
+    polymarket_btc_tag_id: str | None = Field(
+        default=None,
+        description="Optional Gamma tag_id for BTC so market selection fetches a pre-filtered page.",
+    )
+
     # BTC 15m Up/Down market selection (Gamma events by series_id)
     polymarket_series_id_15m: str = Field(
         default="10192", description="Gamma series_id for BTC 15m Up/Down events"
@@ -16,18 +16,13 @@ async def insert_snapshots(signal_run_id: int, snapshot: FeatureSnapshot) -> Non
     if not rows:
         return
     async with acquire() as conn:
-        for row in rows:
-            await conn.execute(
-                """
-                INSERT INTO feature_snapshots (signal_run_id, source_id, raw_value, normalized_score, stale)
-                VALUES ($1, $2, $3, $4, $5)
-                """,
-                signal_run_id,
-                row["source_id"],
-                row.get("raw_value"),
-                row.get("normalized_score"),
-                row.get("stale", False),
-            )
+        await conn.executemany(
+            """
+            INSERT INTO feature_snapshots (signal_run_id, source_id, raw_value, normalized_score, stale)
+            VALUES ($1, $2, $3, $4, $5)
+            """,
+            [(signal_run_id, *row) for row in rows],
+        )
     logger.info("feature_snapshots_inserted", signal_run_id=signal_run_id, count=len(rows))
 
 
@@ -24,10 +24,14 @@ async def upsert_market_metadata(
     slug: str | None = None,
     resolution_source: str | None = None,
     end_date: str | None = None,
+    question: str | None = None,
+    outcomes_json: str | None = None,
 ) -> None:
     """
     Upsert market_metadata row. Call when we select a market (e.g. /signal stub).
     end_date: ISO string from Gamma (e.g. 2026-01-30T23:59:59Z).
+    question/outcomes_json: Gamma question and raw outcomes JSON string, cached so
+    the EOD job can resolve outcomes without a Gamma round-trip.
     """
     pool = get_pool()
     if pool is None:
@@ -38,18 +42,23 @@ async def upsert_market_metadata(
         async with acquire() as conn:
             await conn.execute(
                 """
-                INSERT INTO market_metadata (condition_id, slug, resolution_source, end_date_utc, updated_at)
-                VALUES ($1, $2, $3, $4, NOW())
+                INSERT INTO market_metadata
+                    (condition_id, slug, resolution_source, end_date_utc, question, outcomes_json, updated_at)
+                VALUES ($1, $2, $3, $4, $5, $6, NOW())
                 ON CONFLICT (condition_id) DO UPDATE SET
                     slug = EXCLUDED.slug,
                     resolution_source = EXCLUDED.resolution_source,
                     end_date_utc = EXCLUDED.end_date_utc,
+                    question = COALESCE(EXCLUDED.question, market_metadata.question),
+                    outcomes_json = COALESCE(EXCLUDED.outcomes_json, market_metadata.outcomes_json),
                     updated_at = NOW()
                 """,
                 condition_id,
                 slug,
                 resolution_source,
                 end_dt,
+                question,
+                outcomes_json,
             )
         logger.debug("market_metadata_upserted", condition_id=condition_id, slug=slug)
     except Exception as e:
@@ -57,12 +57,15 @@ CREATE TABLE IF NOT EXISTS feature_snapshots (
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
--- Market metadata: condition_id, slug, resolution_source, end_date_utc (for outcome recording)
+-- Market metadata: condition_id, slug, resolution_source, end_date_utc (for outcome recording).
+-- question/outcomes_json cache the Gamma payload so EOD resolution needs no API call.
 CREATE TABLE IF NOT EXISTS market_metadata (
     condition_id TEXT NOT NULL PRIMARY KEY,
     slug TEXT,
     resolution_source TEXT,
     end_date_utc TIMESTAMPTZ,
+    question TEXT,
+    outcomes_json TEXT,
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
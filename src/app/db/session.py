@@ -1,5 +1,6 @@
 """Async Postgres connection pool. No secrets in logs."""
 
+import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -21,11 +22,15 @@ async def init_pool() -> Pool | None:
     try:
         _pool = await asyncpg.create_pool(
             settings.database_url,
-            min_size=1,
+            # min_size=2 keeps a warm connection each for the webhook path and
+            # background jobs (sheets sync, EOD outcomes) so neither pays a
+            # connect+auth round-trip after idle periods
+            min_size=2,
             max_size=5,
+            max_inactive_connection_lifetime=600,
             command_timeout=10,
         )
-        logger.info("db_pool_created", min_size=1, max_size=5)
+        logger.info("db_pool_created", min_size=2, max_size=5)
         return _pool
     except Exception as e:
         logger.warning("db_pool_init_failed", error=str(e))
@@ -69,3 +74,22 @@ async def health_check() -> bool:
     except Exception as e:
         logger.warning("db_health_check_failed", error=str(e))
         return False
+
+
+# Short-TTL cache so hot paths (e.g. one check per Telegram update) don't pay
+# a DB round-trip each time
+HEALTH_CACHE_TTL = 1.0
+_health_cache_ok = False
+_health_cache_at = 0.0
+
+
+async def cached_health_check(ttl: float = HEALTH_CACHE_TTL) -> bool:
+    """health_check with its result cached for `ttl` seconds."""
+    global _health_cache_ok, _health_cache_at
+    now = time.monotonic()
+    if now - _health_cache_at < ttl:
+        return _health_cache_ok
+    ok = await health_check()
+    _health_cache_ok = ok
+    _health_cache_at = now
+    return ok
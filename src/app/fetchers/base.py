@@ -3,8 +3,11 @@
 import asyncio
 import time
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, AsyncIterator
+
+import httpx
 
 from app.config import get_settings
 from app.logging_config import get_logger
@@ -12,7 +15,15 @@ from app.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class FetcherContext:
+    """Shared per-snapshot resources: one settings read, one keep-alive HTTP client."""
+
+    client: httpx.AsyncClient
+    timeout: float
+
+
+@dataclass(slots=True, frozen=True)
 class FetcherResult:
     """Single source result: raw value, normalized score (-2..+2 or 0-1), stale flag."""
 
@@ -137,6 +148,18 @@ class BaseFetcher(ABC):
     source_id: str = "base"
     max_age_seconds: float = 86400  # 24h default
 
+    def __init__(self, ctx: FetcherContext | None = None) -> None:
+        self.ctx = ctx
+
+    @asynccontextmanager
+    async def _http(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the shared context client, or a one-shot client when run standalone."""
+        if self.ctx is not None:
+            yield self.ctx.client
+        else:
+            async with httpx.AsyncClient(timeout=get_fetcher_timeout()) as client:
+                yield client
+
     def _error_result(self, error: str | Exception) -> FetcherResult:
         """Return a failed FetcherResult for this source. Use in except blocks."""
         return error_result(self.source_id, error)
@@ -3,8 +3,9 @@
 import asyncio
 import time
 import httpx
-from app.fetchers.base import BaseFetcher, FetcherResult, get_fetcher_timeout, with_retry
+from app.fetchers.base import BaseFetcher, FetcherResult, with_retry
 from app.fetchers.bounds import check_bounds, out_of_range_result
+from app.json_util import json_loads
 
 DXY_URL = "https://query1.finance.yahoo.com/v8/finance/chart/DX-Y.NYB?range=5d&interval=1d"
 DXY_429_RETRY_DELAY = 5.0  # seconds before retry on rate limit
@@ -32,13 +33,12 @@ class DxyFetcher(BaseFetcher):
             return None
 
     async def _do_fetch(self) -> FetcherResult:
-        timeout = get_fetcher_timeout()
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with self._http() as client:
             for attempt in range(DXY_429_MAX_ATTEMPTS):
                 try:
                     resp = await client.get(DXY_URL)
                     resp.raise_for_status()
-                    data = resp.json()
+                    data = json_loads(resp.content)
                     break
                 except httpx.HTTPStatusError as e:
                     if e.response.status_code == 429 and attempt < DXY_429_MAX_ATTEMPTS - 1:
@@ -5,9 +5,9 @@ import time
 from datetime import datetime, timezone
 from urllib.parse import urlparse
 
-import httpx
-from app.fetchers.base import BaseFetcher, FetcherResult, get_fetcher_timeout, with_retry
+from app.fetchers.base import BaseFetcher, FetcherResult, with_retry
 from app.fetchers.bounds import check_bounds, out_of_range_result
+from app.json_util import json_loads
 
 # Default; override with ETF_FLOWS_URL in .env if domain differs or service moved
 DEFAULT_ETF_FLOWS_URL = "https://api.sosovalue.com/api/etf-flows"
@@ -45,10 +45,10 @@ class EtfFlowsFetcher(BaseFetcher):
                 error="invalid_etf_flows_url",
             )
         try:
-            async with httpx.AsyncClient(timeout=get_fetcher_timeout()) as client:
+            async with self._http() as client:
                 resp = await client.get(url)
                 resp.raise_for_status()
-                data = resp.json()
+                data = json_loads(resp.content)
             raw = data.get("btc_etf_net_flow_usd") or data.get("net_flow") or 0
             raw_f = float(raw)
             if not check_bounds(self.source_id, raw_f):
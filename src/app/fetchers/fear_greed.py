@@ -2,9 +2,9 @@
 
 import time
 
-import httpx
-from app.fetchers.base import BaseFetcher, FetcherResult, get_fetcher_timeout, with_retry
+from app.fetchers.base import BaseFetcher, FetcherResult, with_retry
 from app.fetchers.bounds import check_bounds, out_of_range_result
+from app.json_util import json_loads
 
 FEAR_GREED_URL = "https://api.alternative.me/fng/?limit=1"
 
@@ -33,10 +33,10 @@ class FearGreedFetcher(BaseFetcher):
 
     async def _do_fetch(self) -> FetcherResult:
         try:
-            async with httpx.AsyncClient(timeout=get_fetcher_timeout()) as client:
+            async with self._http() as client:
                 resp = await client.get(FEAR_GREED_URL)
                 resp.raise_for_status()
-                data = resp.json()
+                data = json_loads(resp.content)
             items = data.get("data", [])
             if not items:
                 return FetcherResult(
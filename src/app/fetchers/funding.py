@@ -2,8 +2,9 @@
 
 import time
 import httpx
-from app.fetchers.base import BaseFetcher, FetcherResult, get_fetcher_timeout, with_retry
+from app.fetchers.base import BaseFetcher, FetcherResult, with_retry
 from app.fetchers.bounds import check_bounds, out_of_range_result
+from app.json_util import json_loads
 
 BINANCE_FUNDING = "https://fapi.binance.com/fapi/v1/premiumIndex?symbol=BTCUSDT"
 BYBIT_FUNDING = (
@@ -43,7 +44,7 @@ class FundingFetcher(BaseFetcher):
         try:
             resp = await client.get(BINANCE_FUNDING)
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 451:
                 return None
@@ -68,7 +69,7 @@ class FundingFetcher(BaseFetcher):
         try:
             resp = await client.get(BYBIT_FUNDING)
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
         except Exception as e:
             return self._error_result(e)
         result = data.get("result", {})
@@ -97,8 +98,7 @@ class FundingFetcher(BaseFetcher):
         return self._result(last_funding, stale=stale)
 
     async def _do_fetch(self) -> FetcherResult:
-        timeout = get_fetcher_timeout()
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with self._http() as client:
             result = await self._fetch_binance(client)
             if result is not None:
                 return result
@@ -1,15 +1,18 @@
 """Macro calendar: FOMC/CPI within 48h. FMP economic calendar when FMP_API_KEY set; else no_event."""
 
 import os
+import re
 from datetime import datetime, timezone
 
-import httpx
-from app.fetchers.base import BaseFetcher, FetcherResult, get_fetcher_timeout, with_retry
+from app.fetchers.base import BaseFetcher, FetcherResult, with_retry
+from app.json_util import json_loads
 
 # FMP economic calendar (free tier: 250 req/day). Requires apikey query param.
 DEFAULT_FMP_ECONOMIC_CALENDAR_URL = "https://financialmodelingprep.com/stable/economic-calendar"
 # Event name substrings we treat as high-impact (FOMC, CPI)
 MACRO_KEYWORDS = ("fomc", "fed rate", "cpi ", " consumer price ", "consumer price index")
+# Single alternation: one scan per event name instead of one per keyword
+_MACRO_KEYWORDS_RE = re.compile("|".join(re.escape(kw) for kw in MACRO_KEYWORDS))
 # Hours ahead to consider "within 48h"
 HOURS_AHEAD = 48
 
@@ -17,16 +20,21 @@ HOURS_AHEAD = 48
 def _event_in_next_48h(events: list, now_utc: datetime) -> bool:
     """Return True if any event has a keyword and date is within next 48h."""
     cutoff = now_utc.timestamp() + HOURS_AHEAD * 3600
+    # ISO date strings compare lexicographically: events past this day prefix can be
+    # skipped without keyword scan or full datetime parse (calendar spans months).
+    cutoff_day = datetime.fromtimestamp(cutoff, tz=timezone.utc).strftime("%Y-%m-%d")
     for item in events:
         if not isinstance(item, dict):
             continue
-        name = (item.get("event") or item.get("title") or item.get("name") or "").lower()
-        if not any(kw in name for kw in MACRO_KEYWORDS):
-            continue
         # Parse date: may be "date", "releaseDate", "timestamp", or ISO string
         raw = item.get("date") or item.get("releaseDate") or item.get("timestamp")
         if raw is None:
             continue
+        if isinstance(raw, str) and raw[:10] > cutoff_day:
+            continue
+        name = (item.get("event") or item.get("title") or item.get("name") or "").lower()
+        if _MACRO_KEYWORDS_RE.search(name) is None:
+            continue
         try:
             if isinstance(raw, (int, float)):
                 ts = float(raw)
@@ -71,12 +79,11 @@ class MacroFetcher(BaseFetcher):
                 normalized_score=0.5,
                 stale=False,
             )
-        url = f"{url_base}?apikey={api_key}"
         try:
-            async with httpx.AsyncClient(timeout=get_fetcher_timeout()) as client:
-                resp = await client.get(url)
+            async with self._http() as client:
+                resp = await client.get(url_base, params={"apikey": api_key})
                 resp.raise_for_status()
-                data = resp.json()
+                data = json_loads(resp.content)
             if not isinstance(data, list):
                 data = (
                     data
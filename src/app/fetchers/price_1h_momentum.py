@@ -1,8 +1,7 @@
 """1h price momentum: last closed 1h candle return from Binance for hourly Up/Down signals."""
 
-import httpx
-
-from app.fetchers.base import BaseFetcher, FetcherResult, get_fetcher_timeout, with_retry
+from app.fetchers.base import BaseFetcher, FetcherResult, with_retry
+from app.json_util import json_loads
 
 BINANCE_KLINES_1H = "https://api.binance.com/api/v3/klines?symbol=BTCUSDT&interval=1h&limit=4"
 
@@ -60,12 +59,11 @@ class Price1hMomentumFetcher(BaseFetcher):
             return None
 
     async def _do_fetch(self) -> FetcherResult:
-        timeout = get_fetcher_timeout()
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with self._http() as client:
             try:
                 resp = await client.get(BINANCE_KLINES_1H)
                 resp.raise_for_status()
-                data = resp.json()
+                data = json_loads(resp.content)
             except Exception as e:
                 return self._error_result(e)
         if not data or len(data) < 2:
@@ -1,9 +1,12 @@
 """Price vs 50 MA: Binance primary; CoinGecko fallback when Binance returns 451 (region block)."""
 
 import time
+from dataclasses import replace
+
 import httpx
-from app.fetchers.base import BaseFetcher, FetcherResult, get_fetcher_timeout, with_retry
+from app.fetchers.base import BaseFetcher, FetcherResult, with_retry
 from app.fetchers.bounds import check_bounds, out_of_range_result
+from app.json_util import json_loads
 
 BINANCE_KLINES = "https://api.binance.com/api/v3/klines?symbol=BTCUSDT&interval=1d&limit=51"
 COINGECKO_MARKET_CHART = (
@@ -11,6 +14,8 @@ COINGECKO_MARKET_CHART = (
 )
 # If Binance and CoinGecko last-close diff exceeds this fraction, mark result stale
 PRICE_DISCREPANCY_THRESHOLD = 0.01
+# Cross-check against CoinGecko at most this often (seconds)
+DISCREPANCY_CHECK_INTERVAL = 900
 
 
 def _compute_pct_from_closes(closes: list[float]) -> tuple[float, float] | None:
@@ -28,6 +33,8 @@ def _compute_pct_from_closes(closes: list[float]) -> tuple[float, float] | None:
 class PriceMaFetcher(BaseFetcher):
     source_id = "price_ma"
     max_age_seconds = 3600
+    # Shared across instances so repeated invocations don't re-hit CoinGecko
+    _last_discrepancy_check_at: float = 0.0
 
     def normalize(self, raw: str | float | None) -> float | None:
         """% deviation: >5% above: +1, above: +0.5, below: -0.5, >5% below: -1."""
@@ -52,7 +59,7 @@ class PriceMaFetcher(BaseFetcher):
         try:
             resp = await client.get(BINANCE_KLINES)
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 451:
                 return (None, None)  # region block; try fallback
@@ -109,7 +116,7 @@ class PriceMaFetcher(BaseFetcher):
         try:
             resp = await client.get(COINGECKO_MARKET_CHART)
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
         except Exception as e:
             return self._error_result(e)
         prices = data.get("prices") or []
@@ -155,7 +162,7 @@ class PriceMaFetcher(BaseFetcher):
         try:
             resp = await client.get(COINGECKO_MARKET_CHART)
             resp.raise_for_status()
-            data = resp.json()
+            data = json_loads(resp.content)
         except Exception:
             return None
         prices = data.get("prices") or []
@@ -167,22 +174,18 @@ class PriceMaFetcher(BaseFetcher):
             return None
 
     async def _do_fetch(self) -> FetcherResult:
-        timeout = get_fetcher_timeout()
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with self._http() as client:
             result, binance_price = await self._fetch_binance(client)
             if result is not None and result.error is None:
-                if binance_price is not None and binance_price > 0:
+                now = time.monotonic()
+                due = now - PriceMaFetcher._last_discrepancy_check_at > DISCREPANCY_CHECK_INTERVAL
+                if due and binance_price is not None and binance_price > 0:
                     cg_price = await self._get_coingecko_last_price(client)
                     if cg_price is not None:
+                        PriceMaFetcher._last_discrepancy_check_at = now
                         diff = abs(binance_price - cg_price) / binance_price
                         if diff > PRICE_DISCREPANCY_THRESHOLD:
-                            result = FetcherResult(
-                                source_id=result.source_id,
-                                raw_value=result.raw_value,
-                                normalized_score=result.normalized_score,
-                                stale=True,
-                                error=result.error,
-                            )
+                            result = replace(result, stale=True)
                 return result
             result_cg = await self._fetch_coingecko(client)
             if result_cg is not None:
@@ -2,11 +2,14 @@
 
 import asyncio
 import datetime
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, AsyncIterator
+
+import httpx
 
 from app.config import get_settings
-from app.fetchers.base import FetcherResult
+from app.fetchers.base import FetcherContext, FetcherResult
 from app.fetchers.coinbase_premium import CoinbasePremiumFetcher
 from app.fetchers.dxy import DxyFetcher
 from app.fetchers.etf_flows import EtfFlowsFetcher
@@ -32,8 +35,12 @@ class FeatureSnapshot:
     results: list[FetcherResult] = field(default_factory=list)
     timestamp: str = ""
 
-    def to_rows(self) -> list[dict[str, Any]]:
-        """For DB insert: list of {source_id, raw_value, normalized_score, stale}."""
+    def to_rows(self) -> list[tuple[str, str | None, float | None, bool]]:
+        """For DB insert via executemany: (source_id, raw_value, normalized_score, stale)."""
+        return [(r.source_id, r.raw_value, r.normalized_score, r.stale) for r in self.results]
+
+    def to_dict_rows(self) -> list[dict[str, Any]]:
+        """For API consumers: list of {source_id, raw_value, normalized_score, stale}."""
         return [
             {
                 "source_id": r.source_id,
@@ -45,25 +52,33 @@ class FeatureSnapshot:
         ]
 
 
-def get_all_fetchers() -> list[Any]:
+def get_all_fetchers(ctx: FetcherContext | None = None) -> list[Any]:
     """Return list of fetcher instances. Optional fetchers included when env flags are set."""
     settings = get_settings()
     fetchers: list[Any] = [
-        EtfFlowsFetcher(),
-        FundingFetcher(),
-        DxyFetcher(),
-        FearGreedFetcher(),
-        PriceMaFetcher(),
-        ExchangeNetflowFetcher(),
-        MacroFetcher(),
+        EtfFlowsFetcher(ctx),
+        FundingFetcher(ctx),
+        DxyFetcher(ctx),
+        FearGreedFetcher(ctx),
+        PriceMaFetcher(ctx),
+        ExchangeNetflowFetcher(ctx),
+        MacroFetcher(ctx),
     ]
     if settings.fetch_coinbase_premium:
-        fetchers.append(CoinbasePremiumFetcher())
+        fetchers.append(CoinbasePremiumFetcher(ctx))
     if settings.fetch_stablecoin_issuance:
-        fetchers.append(StablecoinIssuanceFetcher())
+        fetchers.append(StablecoinIssuanceFetcher(ctx))
     return fetchers
 
 
+@asynccontextmanager
+async def _fetcher_context() -> AsyncIterator[FetcherContext]:
+    """One settings read and one keep-alive HTTP client shared by all fetchers in a run."""
+    timeout = get_settings().fetcher_timeout
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        yield FetcherContext(client=client, timeout=timeout)
+
+
 async def _run_fetchers_async(fetchers: list[Any]) -> list[FetcherResult]:
     """Run given fetchers in parallel; return list of FetcherResult."""
     results = await asyncio.gather(*[f.fetch() for f in fetchers], return_exceptions=True)
@@ -92,8 +107,9 @@ async def run_fetchers_for_market(market: Market) -> tuple[FeatureSnapshot, dict
     Else: run_all_fetchers() and get_weights().
     """
     if is_btc_up_down_hourly_market(market):
-        fetchers = get_all_fetchers() + [Price1hMomentumFetcher()]
-        results = await _run_fetchers_async(fetchers)
+        async with _fetcher_context() as ctx:
+            fetchers = get_all_fetchers(ctx) + [Price1hMomentumFetcher(ctx)]
+            results = await _run_fetchers_async(fetchers)
         ts = datetime.datetime.now(datetime.timezone.utc).isoformat()
         logger.info(
             "fetchers_complete",
@@ -108,8 +124,9 @@ async def run_fetchers_for_market(market: Market) -> tuple[FeatureSnapshot, dict
 
 async def run_all_fetchers() -> FeatureSnapshot:
     """Run all fetchers in parallel; return FeatureSnapshot."""
-    fetchers = get_all_fetchers()
-    results = await _run_fetchers_async(fetchers)
+    async with _fetcher_context() as ctx:
+        fetchers = get_all_fetchers(ctx)
+        results = await _run_fetchers_async(fetchers)
     ts = datetime.datetime.now(datetime.timezone.utc).isoformat()
     logger.info("fetchers_complete", count=len(results), errors=sum(1 for x in results if x.error))
     return FeatureSnapshot(results=results, timestamp=ts)
@@ -1,8 +1,8 @@
 """Stablecoin issuance: 24h change in market cap (proxy for supply). CoinGecko free API."""
 
-import httpx
-from app.fetchers.base import BaseFetcher, FetcherResult, get_fetcher_timeout, with_retry
+from app.fetchers.base import BaseFetcher, FetcherResult, with_retry
 from app.fetchers.bounds import check_bounds, out_of_range_result
+from app.json_util import json_loads
 
 # CoinGecko markets: USDT + USDC; market_cap_change_percentage_24h ~ supply change for stablecoins
 COINGECKO_MARKETS = (
@@ -37,10 +37,10 @@ class StablecoinIssuanceFetcher(BaseFetcher):
 
     async def _do_fetch(self) -> FetcherResult:
         try:
-            async with httpx.AsyncClient(timeout=get_fetcher_timeout()) as client:
+            async with self._http() as client:
                 resp = await client.get(COINGECKO_MARKETS)
                 resp.raise_for_status()
-                data = resp.json()
+                data = json_loads(resp.content)
             if not isinstance(data, list) or len(data) < 1:
                 return FetcherResult(
                     source_id=self.source_id,
@@ -0,0 +1,52 @@
+"""Shared httpx clients: one keep-alive pool per upstream API, closed at shutdown."""
+
+import httpx
+
+from app.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _get_client(name: str, timeout: float) -> httpx.AsyncClient:
+    """Return (creating on first use) the shared client for one upstream."""
+    client = _clients.get(name)
+    if client is None or client.is_closed:
+        try:
+            client = httpx.AsyncClient(http2=True, limits=_LIMITS, timeout=timeout)
+        except ImportError:  # pragma: no cover - h2 extra not installed
+            client = httpx.AsyncClient(limits=_LIMITS, timeout=timeout)
+        _clients[name] = client
+    return client
+
+
+def get_gamma_client() -> httpx.AsyncClient:
+    """Shared client for Gamma API calls (markets, events)."""
+    return _get_client("gamma", timeout=15.0)
+
+
+def get_clob_client() -> httpx.AsyncClient:
+    """
+    Shared client for CLOB calls (order book, price). Gathered quote fetches
+    (e.g. build_updown_quote's 4 calls) multiplex as HTTP/2 streams on one
+    keep-alive connection instead of opening TCP/TLS per request.
+    """
+    return _get_client("clob", timeout=10.0)
+
+
+def get_binance_client() -> httpx.AsyncClient:
+    """Shared client for Binance klines."""
+    return _get_client("binance", timeout=10.0)
+
+
+async def close_http_clients() -> None:
+    """Close all shared clients. Call at shutdown."""
+    for name, client in list(_clients.items()):
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("http_client_close_failed", client=name, error=str(e))
+    _clients.clear()
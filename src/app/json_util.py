@@ -0,0 +1,25 @@
+"""JSON helpers: orjson when available (faster parse, fewer allocations), stdlib fallback."""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def json_loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # pragma: no cover - only hit when orjson is not installed
+    import json
+
+    def json_loads(data: bytes | str) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return json.dumps(obj)
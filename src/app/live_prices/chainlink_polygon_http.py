@@ -1,5 +1,6 @@
 """Chainlink BTC/USD on Polygon via HTTP JSON-RPC (latestRoundData)."""
 
+import asyncio
 import time
 from dataclasses import dataclass
 
@@ -108,16 +109,20 @@ async def fetch_chainlink_btc_usd() -> ChainlinkResult:
 
     decimals_cache: int | None = None
     for rpc_url in urls:
-        # Fetch decimals once
+        # decimals() is only needed once; issue it in parallel with latestRoundData()
         if decimals_cache is None:
-            dec_result = await _eth_call(rpc_url, aggregator, DECIMALS_SELECTOR)
+            dec_result, round_result = await asyncio.gather(
+                _eth_call(rpc_url, aggregator, DECIMALS_SELECTOR),
+                _eth_call(rpc_url, aggregator, LATEST_ROUND_DATA_SELECTOR),
+            )
             if dec_result:
                 try:
                     dec_raw = bytes.fromhex(dec_result[2:].ljust(64, "0")[:64])
                     (decimals_cache,) = decode(["uint8"], dec_raw)
                 except (ValueError, TypeError, Exception):
                     pass
-        round_result = await _eth_call(rpc_url, aggregator, LATEST_ROUND_DATA_SELECTOR)
+        else:
+            round_result = await _eth_call(rpc_url, aggregator, LATEST_ROUND_DATA_SELECTOR)
         if not round_result:
             continue
         decoded = _decode_latest_round_data(round_result)
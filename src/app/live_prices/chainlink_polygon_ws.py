@@ -1,13 +1,14 @@
 """Chainlink BTC/USD on Polygon via WSS eth_subscribe logs (AnswerUpdated)."""
 
 import asyncio
-import json
+import struct
 from dataclasses import dataclass
+from functools import lru_cache
 
-import websockets
-from websockets.legacy.client import WebSocketClientProtocol
+from websockets.asyncio.client import ClientConnection, connect
 
 from app.config import get_settings
+from app.json_util import json_dumps, json_loads
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -17,7 +18,7 @@ logger = get_logger(__name__)
 ANSWER_UPDATED_TOPIC0 = "0x0559884fd3a460db3073b7fc896cc77986f16e3782ede84b58e76676e0d1c3f"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainlinkWsTick:
     """Last price from Chainlink Polygon WSS."""
 
@@ -26,12 +27,19 @@ class ChainlinkWsTick:
     source: str = "chainlink_ws"
 
 
+# Single-process tick store: one slotted instance mutated in place by the
+# reader task and shared by reference with get_last() consumers
 _last: ChainlinkWsTick = ChainlinkWsTick()
-_ws: WebSocketClientProtocol | None = None
+_ws: ClientConnection | None = None
 _task: asyncio.Task | None = None
 _sub_id: str | None = None
 _reconnect_delay = 0.5
 _decimals = 8
+# Paired with _decimals; keep both in sync if decimals ever changes
+_inv_scale = 10.0**-_decimals
+# int256 answers for BTC/USD fit the low 8 bytes; detect via the zero prefix
+_ZERO24 = b"\x00" * 24
+_unpack_u64 = struct.Struct(">Q").unpack_from
 
 
 def _wss_urls() -> list[str]:
@@ -47,34 +55,78 @@ def get_last() -> ChainlinkWsTick:
     return _last
 
 
+def _buffered_frames(sock: ClientConnection) -> int:
+    """
+    Frames already buffered on the connection. Peeks at a websockets internal
+    (recv_messages.frames, unpinned dependency), so a rename in a future
+    release degrades to 0 — no burst draining — instead of breaking the loop.
+    """
+    frames = getattr(getattr(sock, "recv_messages", None), "frames", None)
+    return len(frames) if frames is not None else 0
+
+
+@lru_cache(maxsize=4)
+def _subscribe_payload(aggregator: str) -> str:
+    """Preformatted eth_subscribe request; serialized once per aggregator."""
+    return json_dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "eth_subscribe",
+            "params": [
+                "logs",
+                {"address": aggregator, "topics": [ANSWER_UPDATED_TOPIC0]},
+            ],
+        }
+    )
+
+
 def _decode_log(log: dict) -> tuple[float | None, int | None]:
-    """Decode AnswerUpdated log: topics[1]=answer (int256), data=updatedAt (uint256)."""
-    global _decimals
-    topics = log.get("topics") or []
-    if len(topics) < 2:
-        return (None, None)
+    """Decode AnswerUpdated log: topics[1]=answer (int256), data=updatedAt (uint256).
+
+    The subscription pins address and topic0, so the log shape is fixed: index
+    directly and treat any miss as a malformed frame.
+    """
     try:
-        answer_hex = topics[1]
-        answer = int(answer_hex, 16)
-        if answer >= 2**255:
-            answer -= 2**256
-        price = answer / (10**_decimals)
-    except (ValueError, TypeError):
+        h = log["topics"][1]
+        if h.startswith("0x"):
+            h = h[2:]
+        # bytes.fromhex + int.from_bytes is one C-level decode vs int(str, 16)
+        b = bytes.fromhex(h)
+        if len(b) == 32 and b[:24] == _ZERO24:
+            # Fast path: single 8-byte unsigned load for realistic answers
+            answer = _unpack_u64(b, 24)[0]
+        else:
+            answer = int.from_bytes(b, "big", signed=True)
+        price = answer * _inv_scale
+    except (KeyError, IndexError, ValueError, TypeError):
         return (None, None)
-    data_hex = log.get("data")
     updated_at_ms = None
+    data_hex = log.get("data")
     if data_hex:
         try:
-            updated_at = int(data_hex, 16)
-            updated_at_ms = updated_at * 1000
+            h = data_hex[2:] if data_hex.startswith("0x") else data_hex
+            updated_at_ms = int.from_bytes(bytes.fromhex(h), "big") * 1000
         except (ValueError, TypeError):
             pass
     return (price, updated_at_ms)
 
 
+def _parse_frame(raw: str | bytes) -> tuple[float | None, int | None]:
+    """Parse one WS frame; return (price, updated_at_ms) or (None, None)."""
+    try:
+        m = json_loads(raw)
+        if m.get("method") != "eth_subscription":
+            return (None, None)
+        result = m["params"]["result"]
+    except (ValueError, TypeError, KeyError):
+        return (None, None)
+    return _decode_log(result)
+
+
 async def _run_loop() -> None:
     """Connect to Polygon WSS, subscribe to logs, process with reconnect."""
-    global _last, _ws, _sub_id, _reconnect_delay, _decimals, _task
+    global _ws, _sub_id, _reconnect_delay, _decimals, _task
     settings = get_settings()
     aggregator = settings.chainlink_btc_usd_aggregator
     urls = _wss_urls()
@@ -85,51 +137,37 @@ async def _run_loop() -> None:
         url = urls[url_index % len(urls)]
         url_index += 1
         try:
-            async with websockets.connect(
+            async with connect(
                 url,
                 open_timeout=10,
                 close_timeout=5,
                 ping_interval=20,
                 ping_timeout=10,
+                # Small text frames: permessage-deflate costs more CPU than it
+                # saves, and tight buffers bound memory if the reader stalls
+                compression=None,
+                max_size=65536,
+                max_queue=32,
             ) as sock:
                 _ws = sock
                 _reconnect_delay = 0.5
-                req = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "eth_subscribe",
-                    "params": [
-                        "logs",
-                        {"address": aggregator, "topics": [ANSWER_UPDATED_TOPIC0]},
-                    ],
-                }
-                await sock.send(json.dumps(req))
+                await sock.send(_subscribe_payload(aggregator))
                 raw = await sock.recv()
-                if isinstance(raw, bytes):
-                    raw = raw.decode("utf-8", errors="replace")
-                msg = json.loads(raw)
+                msg = json_loads(raw)
                 if msg.get("result") and isinstance(msg["result"], str):
                     _sub_id = msg["result"]
                 async for raw_msg in sock:
-                    if isinstance(raw_msg, bytes):
-                        raw_msg = raw_msg.decode("utf-8", errors="replace")
-                    try:
-                        m = json.loads(raw_msg)
-                    except (json.JSONDecodeError, TypeError):
-                        continue
-                    if m.get("method") != "eth_subscription":
-                        continue
-                    params = m.get("params") or {}
-                    result = params.get("result")
-                    if not result:
-                        continue
-                    price, updated_at_ms = _decode_log(result)
+                    price, updated_at_ms = _parse_frame(raw_msg)
+                    # Drain frames already buffered so a burst costs one
+                    # event-loop turn; only the newest tick matters
+                    while _buffered_frames(sock):
+                        p, ts = _parse_frame(await sock.recv(decode=False))
+                        if p is not None:
+                            price, updated_at_ms = p, ts
                     if price is not None:
-                        _last = ChainlinkWsTick(
-                            price=price,
-                            updated_at_ms=updated_at_ms,
-                            source="chainlink_ws",
-                        )
+                        # Mutate the shared tick in place; no per-tick allocation
+                        _last.updated_at_ms = updated_at_ms
+                        _last.price = price
         except asyncio.CancelledError:
             break
         except Exception as e:
@@ -147,8 +185,7 @@ def start_background() -> None:
         return
     if not _wss_urls():
         return
-    loop = asyncio.get_event_loop()
-    _task = loop.create_task(_run_loop())
+    _task = asyncio.create_task(_run_loop())
     logger.info("chainlink_ws_started")
 
 
@@ -1,19 +1,18 @@
 """Polymarket live WebSocket: crypto_prices_chainlink topic (BTC)."""
 
 import asyncio
-import json
 from dataclasses import dataclass
 
-import websockets
-from websockets.legacy.client import WebSocketClientProtocol
+from websockets.asyncio.client import ClientConnection, connect
 
 from app.config import get_settings
+from app.json_util import json_dumps, json_loads
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PolymarketWsTick:
     """Last price from Polymarket WS."""
 
@@ -22,53 +21,94 @@ class PolymarketWsTick:
     source: str = "polymarket_ws"
 
 
+# Single-process tick store: one slotted instance mutated in place by the
+# reader task and shared by reference with get_last() consumers
 _last: PolymarketWsTick = PolymarketWsTick()
-_ws: WebSocketClientProtocol | None = None
+_ws: ClientConnection | None = None
 _task: asyncio.Task | None = None
 _reconnect_delay = 0.5
 _symbol_filter = "btc"
+# Subscribe request never changes; serialize it once at import
+_SUBSCRIBE_PAYLOAD = json_dumps(
+    {
+        "action": "subscribe",
+        "subscriptions": [{"topic": "crypto_prices_chainlink", "type": "*", "filters": ""}],
+    }
+)
+# Raw-frame prefilter: C-level substring search beats parsing non-BTC frames
+_SYMBOL_NEEDLES_BYTES = (b"btc", b"BTC", b"Btc")
+_SYMBOL_NEEDLES_STR = ("btc", "BTC", "Btc")
+# Candidate key names per field; the live feed uses one of each, learned on
+# first successful parse and probed directly afterwards
+_SYMBOL_KEYS = ("symbol", "pair", "ticker")
+_PRICE_KEYS = ("value", "price", "current", "data")
+_TS_KEYS = ("timestamp", "updatedAt")
+_symbol_key: str | None = None
+_price_key: str | None = None
+_ts_key: str | None = None
+
+
+def _to_ms(ts) -> int | None:
+    """Epoch seconds (int/float/str, optionally fractional) -> ms, integer math for strings."""
+    if ts is None:
+        return None
+    try:
+        if isinstance(ts, str):
+            if "." in ts:
+                whole, _, frac = ts.partition(".")
+                return int(whole) * 1000 + int((frac + "000")[:3])
+            ts = int(ts)
+        if isinstance(ts, int):
+            # Already milliseconds? (any epoch-seconds value this large is year 33658+)
+            return ts if ts > 1_000_000_000_000 else ts * 1000
+        return int(ts * 1000)
+    except (TypeError, ValueError):
+        return None
+
+
+def _payload_get(payload: dict, cached_key: str | None, keys: tuple[str, ...]) -> tuple:
+    """Return (value, key): one probe via the learned key, else scan candidates."""
+    if cached_key is not None:
+        v = payload.get(cached_key)
+        if v is not None:
+            return (v, cached_key)
+    for k in keys:
+        v = payload.get(k)
+        if v is not None:
+            return (v, k)
+    return (None, cached_key)
 
 
-def _parse_price_message(msg: str) -> tuple[float | None, int | None]:
+def _parse_price_message(msg: str | bytes) -> tuple[float | None, int | None]:
     """Parse WS message; return (price, updated_at_ms) or (None, None)."""
+    global _symbol_key, _price_key, _ts_key
+    needles = _SYMBOL_NEEDLES_BYTES if isinstance(msg, bytes) else _SYMBOL_NEEDLES_STR
+    if not any(n in msg for n in needles):
+        return (None, None)
     try:
-        data = json.loads(msg)
-    except (json.JSONDecodeError, TypeError):
+        data = json_loads(msg)
+    except (ValueError, TypeError):
         return (None, None)
     if data.get("topic") != "crypto_prices_chainlink":
         return (None, None)
     payload = data.get("payload")
     if isinstance(payload, str):
         try:
-            payload = json.loads(payload)
-        except (json.JSONDecodeError, TypeError):
+            payload = json_loads(payload)
+        except (ValueError, TypeError):
             return (None, None)
     if not isinstance(payload, dict):
         return (None, None)
-    symbol = str(
-        payload.get("symbol") or payload.get("pair") or payload.get("ticker") or ""
-    ).lower()
-    if _symbol_filter not in symbol:
+    raw_symbol, _symbol_key = _payload_get(payload, _symbol_key, _SYMBOL_KEYS)
+    if _symbol_filter not in str(raw_symbol or "").lower():
         return (None, None)
-    raw_price = (
-        payload.get("value")
-        or payload.get("price")
-        or payload.get("current")
-        or payload.get("data")
-    )
+    raw_price, _price_key = _payload_get(payload, _price_key, _PRICE_KEYS)
     try:
         price = float(raw_price)
     except (TypeError, ValueError):
         return (None, None)
-    ts = payload.get("timestamp") or payload.get("updatedAt")
-    if ts is not None:
-        try:
-            updated_at_ms = int(float(ts) * 1000)
-        except (TypeError, ValueError):
-            updated_at_ms = None
-    else:
-        updated_at_ms = None
-    return (price, updated_at_ms)
+    ts, _ts_key = _payload_get(payload, _ts_key, _TS_KEYS)
+    return (price, _to_ms(ts))
 
 
 def get_last() -> PolymarketWsTick:
@@ -76,44 +116,52 @@ def get_last() -> PolymarketWsTick:
     return _last
 
 
+def _buffered_frames(sock: ClientConnection) -> int:
+    """
+    Frames already buffered on the connection. Peeks at a websockets internal
+    (recv_messages.frames, unpinned dependency), so a rename in a future
+    release degrades to 0 — no burst draining — instead of breaking the loop.
+    """
+    frames = getattr(getattr(sock, "recv_messages", None), "frames", None)
+    return len(frames) if frames is not None else 0
+
+
 async def _run_loop() -> None:
     """Connect, subscribe, and process messages with reconnect backoff."""
-    global _last, _ws, _reconnect_delay, _task
+    global _ws, _reconnect_delay, _task
     settings = get_settings()
     url = settings.polymarket_live_ws_url
     if not url:
         return
     while True:
         try:
-            async with websockets.connect(
+            async with connect(
                 url,
                 open_timeout=10,
                 close_timeout=5,
                 ping_interval=20,
                 ping_timeout=10,
+                # Small text frames: permessage-deflate costs more CPU than it
+                # saves, and tight buffers bound memory if the reader stalls
+                compression=None,
+                max_size=65536,
+                max_queue=32,
             ) as sock:
                 _ws = sock
                 _reconnect_delay = 0.5
-                await sock.send(
-                    json.dumps(
-                        {
-                            "action": "subscribe",
-                            "subscriptions": [
-                                {"topic": "crypto_prices_chainlink", "type": "*", "filters": ""}
-                            ],
-                        }
-                    )
-                )
+                await sock.send(_SUBSCRIBE_PAYLOAD)
                 async for raw in sock:
-                    if isinstance(raw, bytes):
-                        raw = raw.decode("utf-8", errors="replace")
                     price, updated_at_ms = _parse_price_message(raw)
+                    # Drain frames already buffered so a burst costs one
+                    # event-loop turn; only the newest tick matters
+                    while _buffered_frames(sock):
+                        p, ts = _parse_price_message(await sock.recv(decode=False))
+                        if p is not None:
+                            price, updated_at_ms = p, ts
                     if price is not None:
-                        _last = PolymarketWsTick(
-                            price=price,
-                            updated_at_ms=updated_at_ms,
-                            source="polymarket_ws",
-                        )
+                        # Mutate the shared tick in place; no per-tick allocation
+                        _last.updated_at_ms = updated_at_ms
+                        _last.price = price
         except asyncio.CancelledError:
             break
         except Exception as e:
@@ -128,8 +176,7 @@ def start_background() -> None:
     global _task
     if _task is not None and not _task.done():
         return
-    loop = asyncio.get_event_loop()
-    _task = loop.create_task(_run_loop())
+    _task = asyncio.create_task(_run_loop())
     logger.info("polymarket_ws_started")
 
 
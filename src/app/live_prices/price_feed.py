@@ -10,7 +10,7 @@ from app.live_prices.chainlink_polygon_ws import get_last as chainlink_ws_get_la
 from app.live_prices.polymarket_chainlink_ws import get_last as polymarket_ws_get_last
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceTick:
     """Best available price with timestamp and source."""
 
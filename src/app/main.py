@@ -1,16 +1,23 @@
 """FastAPI app: health, webhook (Telegram). Verify secret; whitelist users."""
 
+try:  # Faster event loop for the WS receive loops and webhook handlers
+    import uvloop
+
+    uvloop.install()
+except ImportError:  # pragma: no cover - uvloop unavailable (e.g. Windows dev box)
+    pass
+
 import asyncio
 import sys
 from contextlib import asynccontextmanager
-from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from app.config import get_settings
-from app.db.session import close_pool, health_check, init_pool
+from app.db.session import cached_health_check, close_pool, init_pool
+from app.json_util import json_dumps
 from app.logging_config import configure_logging, get_logger
 from app.telegram.admin import send_admin_alert
 from app.telegram.handler import handle_update
@@ -31,35 +38,18 @@ def validate_startup_config() -> None:
     if os.environ.get("CRYPTOSIGNAL_SKIP_STARTUP_VALIDATION"):
         return
 
-    # Add scripts to path for validation import
-    project_root = Path(__file__).parent.parent.parent
-    scripts_path = project_root / "scripts"
-    sys.path.insert(0, str(scripts_path))
+    from app.validate_env import ValidationError, validate_env
 
     try:
-        from validate_env import validate_env, ValidationError
-
-        # Validate required environment variables
-        try:
-            validate_env(mode="required")
-            logger.info("startup_validation_passed", msg="Environment configuration validated")
-        except ValidationError as e:
-            logger.error("startup_validation_failed", error=str(e))
-            print(f"\n❌ Startup validation failed: {e}\n", file=sys.stderr)
-            print("Fix the errors in your .env file and restart.\n", file=sys.stderr)
-            print("Run this to validate manually:", file=sys.stderr)
-            print("  uv run python scripts/validate_env.py\n", file=sys.stderr)
-            sys.exit(1)
-    except ImportError:
-        # Validation script not available, log warning and continue
-        logger.warning(
-            "startup_validation_skipped",
-            msg="validate_env.py not found, skipping startup validation",
-        )
-    finally:
-        # Clean up path
-        if str(scripts_path) in sys.path:
-            sys.path.remove(str(scripts_path))
+        validate_env(mode="required")
+        logger.info("startup_validation_passed", msg="Environment configuration validated")
+    except ValidationError as e:
+        logger.error("startup_validation_failed", error=str(e))
+        print(f"\n❌ Startup validation failed: {e}\n", file=sys.stderr)
+        print("Fix the errors in your .env file and restart.\n", file=sys.stderr)
+        print("Run this to validate manually:", file=sys.stderr)
+        print("  uv run python scripts/validate_env.py\n", file=sys.stderr)
+        sys.exit(1)
 
 
 @asynccontextmanager
@@ -71,6 +61,11 @@ async def lifespan(app: FastAPI):
     # Validate configuration before starting
     validate_startup_config()
 
+    # Eager tasks (3.12+): gathered sub-tasks that finish without suspending
+    # (cache hits, fast DB paths) skip a scheduler round trip
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # Initialize database pool
     await init_pool()
 
@@ -95,6 +90,9 @@ async def lifespan(app: FastAPI):
     finally:
         logger.info("shutdown_starting", msg="Shutting down CryptoSignal bot")
         try:
+            from app.http_client import close_http_clients
+
+            await close_http_clients()
             await close_pool()
         except (asyncio.CancelledError, KeyboardInterrupt):
             raise  # Preserve Ctrl+C / SIGINT so process exits cleanly
@@ -102,13 +100,24 @@ async def lifespan(app: FastAPI):
             logger.exception("lifespan_shutdown_error")
 
 
-app = FastAPI(title="CryptoSignal Bot", lifespan=lifespan)
+app = FastAPI(title="CryptoSignal Bot", lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Constant reply bodies serialized once at import; hot paths return them as-is
+# instead of re-encoding the same dict per request
+_BODY_FORBIDDEN_CRON = json_dumps({"error": "missing or invalid X-Cron-Secret"})
+_BODY_DB_UNAVAILABLE = json_dumps({"ok": "false", "error": "db_unavailable"})
+_BODY_WEBHOOK_OK = json_dumps({"ok": "true"})
+
+
+def _static_json(body: str, status_code: int) -> Response:
+    """Response for a pre-serialized JSON body."""
+    return Response(content=body, status_code=status_code, media_type="application/json")
 
 
 @app.get("/")
-async def root() -> JSONResponse:
+async def root() -> ORJSONResponse:
     """Root route for health checks and discovery. Returns 200 so Render/browsers don't get 404."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200,
         content={
             "service": "CryptoSignal Bot",
@@ -119,11 +128,11 @@ async def root() -> JSONResponse:
 
 
 @app.get("/health")
-async def health() -> JSONResponse:
+async def health() -> ORJSONResponse:
     """Health check for uptime monitoring. 503 if DB down. Includes last_signal_at and data_sources when DB is up."""
-    db_ok = await health_check()
+    db_ok = await cached_health_check()
     if not db_ok:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={"status": "unavailable", "db": "disconnected"},
         )
@@ -138,11 +147,11 @@ async def health() -> JSONResponse:
         "last_signal_at": last_signal_at,
         "data_sources": data_sources,
     }
-    return JSONResponse(status_code=200, content=content)
+    return ORJSONResponse(status_code=200, content=content)
 
 
 @app.post("/internal/run-daily-signal")
-async def run_daily_signal(request: Request) -> JSONResponse:
+async def run_daily_signal(request: Request) -> Response:
     """
     Cron: run daily signal pipeline and send to all allowed users.
     Idempotent per day: reuses existing run if already generated. Protected by X-Cron-Secret (same as EOD).
@@ -151,29 +160,26 @@ async def run_daily_signal(request: Request) -> JSONResponse:
 
     settings = get_settings()
     if settings.eod_cron_secret is None:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=403,
             content={"error": "EOD_CRON_SECRET required (use for X-Cron-Secret)"},
         )
     secret = request.headers.get("X-Cron-Secret")
     if secret != settings.eod_cron_secret:
-        return JSONResponse(
-            status_code=403,
-            content={"error": "missing or invalid X-Cron-Secret"},
-        )
+        return _static_json(_BODY_FORBIDDEN_CRON, 403)
     try:
         result = await run_daily_signal_broadcast()
-        return JSONResponse(status_code=200, content=result)
+        return ORJSONResponse(status_code=200, content=result)
     except Exception as e:
         logger.exception("daily_signal_error")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": str(e)},
         )
 
 
 @app.post("/internal/run-eod-outcomes")
-async def run_eod_outcomes(request: Request) -> JSONResponse:
+async def run_eod_outcomes(request: Request) -> Response:
     """
     Phase 5: EOD job. Resolve outcomes for signal runs whose market has ended.
     Call after 00:00 UTC (e.g. cron). EOD_CRON_SECRET required: set in env and
@@ -183,32 +189,29 @@ async def run_eod_outcomes(request: Request) -> JSONResponse:
 
     settings = get_settings()
     if settings.eod_cron_secret is None:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=403,
             content={"error": "EOD_CRON_SECRET required"},
         )
     secret = request.headers.get("X-Cron-Secret")
     if secret != settings.eod_cron_secret:
-        return JSONResponse(
-            status_code=403,
-            content={"error": "missing or invalid X-Cron-Secret"},
-        )
+        return _static_json(_BODY_FORBIDDEN_CRON, 403)
     try:
         result = await run_eod()
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"ok": True, "updated": result["updated"], "failed": result["failed"]},
         )
     except Exception as e:
         logger.exception("eod_outcomes_error")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": str(e)},
         )
 
 
 @app.post("/internal/admin-heartbeat")
-async def admin_heartbeat(request: Request) -> JSONResponse:
+async def admin_heartbeat(request: Request) -> Response:
     """
     Cron: send short heartbeat to ADMIN_CHAT_ID (e.g. "Last signal at X, direction Y").
     Protected by X-Cron-Secret. No-op if ADMIN_CHAT_ID or EOD_CRON_SECRET unset.
@@ -218,16 +221,13 @@ async def admin_heartbeat(request: Request) -> JSONResponse:
 
     settings = get_settings()
     if not settings.admin_chat_id or not settings.eod_cron_secret:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"ok": True, "skipped": "ADMIN_CHAT_ID or EOD_CRON_SECRET unset"},
         )
     secret = request.headers.get("X-Cron-Secret")
     if secret != settings.eod_cron_secret:
-        return JSONResponse(
-            status_code=403,
-            content={"error": "missing or invalid X-Cron-Secret"},
-        )
+        return _static_json(_BODY_FORBIDDEN_CRON, 403)
     last_at = await get_last_signal_at()
     if last_at:
         # Optional: fetch last run direction from DB for richer message
@@ -242,18 +242,18 @@ async def admin_heartbeat(request: Request) -> JSONResponse:
     else:
         msg = "CryptoSignal heartbeat: no signals yet."
     await send_admin_alert(msg)
-    return JSONResponse(status_code=200, content={"ok": True, "sent": True})
+    return ORJSONResponse(status_code=200, content={"ok": True, "sent": True})
 
 
 @app.get("/api/signals")
-async def api_signals(request: Request, limit: int = 20) -> JSONResponse:
+async def api_signals(request: Request, limit: int = 20) -> Response:
     """Read-only: last N signal runs. Requires X-Cron-Secret (same as EOD)."""
     settings = get_settings()
     if (
         settings.eod_cron_secret
         and request.headers.get("X-Cron-Secret") != settings.eod_cron_secret
     ):
-        return JSONResponse(status_code=403, content={"error": "missing or invalid X-Cron-Secret"})
+        return _static_json(_BODY_FORBIDDEN_CRON, 403)
     from app.db.session import acquire
 
     limit = min(100, max(1, limit))
@@ -272,7 +272,7 @@ async def api_signals(request: Request, limit: int = 20) -> JSONResponse:
         out.append(
             {
                 "id": r["id"],
-                "run_at": r["run_at"].isoformat() if r["run_at"] else None,
+                "run_at": r["run_at"],
                 "market_slug": r["market_slug"],
                 "direction": r["direction"],
                 "model_p": float(r["model_p"]) if r["model_p"] is not None else None,
@@ -284,18 +284,18 @@ async def api_signals(request: Request, limit: int = 20) -> JSONResponse:
                 "outcome": r["outcome"],
             }
         )
-    return JSONResponse(status_code=200, content={"signals": out})
+    return ORJSONResponse(status_code=200, content={"signals": out})
 
 
 @app.get("/api/stats")
-async def api_stats(request: Request) -> JSONResponse:
+async def api_stats(request: Request) -> Response:
     """Read-only: win rate (last 30), streak, max drawdown. Requires X-Cron-Secret."""
     settings = get_settings()
     if (
         settings.eod_cron_secret
         and request.headers.get("X-Cron-Secret") != settings.eod_cron_secret
     ):
-        return JSONResponse(status_code=403, content={"error": "missing or invalid X-Cron-Secret"})
+        return _static_json(_BODY_FORBIDDEN_CRON, 403)
     from app.analytics.calibration import calibration_summary
     from app.analytics.drawdown import max_drawdown
     from app.analytics.rolling import current_streak, rolling_win_rate
@@ -304,7 +304,7 @@ async def api_stats(request: Request) -> JSONResponse:
     streak = await current_streak()
     dd = await max_drawdown(100)
     cal = await calibration_summary()
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200,
         content={
             "win_rate_30": win,
@@ -316,7 +316,7 @@ async def api_stats(request: Request) -> JSONResponse:
 
 
 @app.get("/api/15m-snapshot")
-async def api_15m_snapshot(request: Request) -> JSONResponse:
+async def api_15m_snapshot(request: Request) -> Response:
     """
     Current BTC 15m Up/Down market + quote + remaining_minutes.
     Optional: last stored signal for this market. For console dashboard consumption.
@@ -327,20 +327,20 @@ async def api_15m_snapshot(request: Request) -> JSONResponse:
         settings.eod_cron_secret
         and request.headers.get("X-Cron-Secret") != settings.eod_cron_secret
     ):
-        return JSONResponse(status_code=403, content={"error": "missing or invalid X-Cron-Secret"})
+        return _static_json(_BODY_FORBIDDEN_CRON, 403)
     from datetime import datetime, timezone
 
     from app.polymarket.selection_15m import build_updown_quote, select_btc_15m_updown_market
 
     market = await select_btc_15m_updown_market()
     if not market:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"ok": False, "reason": "no_market", "market": None, "quote": None},
         )
     quote = await build_updown_quote(market)
     if not quote:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "ok": False,
@@ -383,11 +383,11 @@ async def api_15m_snapshot(request: Request) -> JSONResponse:
                 "recommended_usd": float(row["recommended_usd"])
                 if row["recommended_usd"] is not None
                 else None,
-                "run_at": row["run_at"].isoformat() if row["run_at"] else None,
+                "run_at": row["run_at"],
             }
     except Exception:
         pass
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200,
         content={
             "ok": True,
@@ -411,7 +411,7 @@ async def api_15m_snapshot(request: Request) -> JSONResponse:
 
 
 @app.get("/api/live-data")
-async def api_live_data(request: Request) -> JSONResponse:
+async def api_live_data(request: Request) -> Response:
     """
     Fetch live data from all configured sources (ETF flows, price/MA, funding, DXY, etc.)
     and return raw + normalized values for analysis. Same data used by the signal engine.
@@ -422,7 +422,7 @@ async def api_live_data(request: Request) -> JSONResponse:
         settings.eod_cron_secret
         and request.headers.get("X-Cron-Secret") != settings.eod_cron_secret
     ):
-        return JSONResponse(status_code=403, content={"error": "missing or invalid X-Cron-Secret"})
+        return _static_json(_BODY_FORBIDDEN_CRON, 403)
     from app.fetchers.registry import run_all_fetchers
 
     snapshot = await run_all_fetchers()
@@ -436,33 +436,30 @@ async def api_live_data(request: Request) -> JSONResponse:
         }
         for r in snapshot.results
     ]
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200,
         content={"timestamp": snapshot.timestamp, "sources": sources},
     )
 
 
 @app.post("/webhook/telegram")
-async def telegram_webhook(request: Request) -> JSONResponse:
+async def telegram_webhook(request: Request) -> Response:
     """
     Telegram webhook. Verify X-Telegram-Bot-Api-Secret-Token; then process Update.
     Returns 403 if secret missing or wrong. Returns 503 on handler or DB failure so Telegram retries.
     """
     verify_telegram_webhook(request)
     body: dict[str, Any] = await request.json()
-    db_ok = await health_check()
+    db_ok = await cached_health_check()
     if not db_ok:
-        return JSONResponse(
-            status_code=503,
-            content={"ok": "false", "error": "db_unavailable"},
-        )
+        return _static_json(_BODY_DB_UNAVAILABLE, 503)
     try:
         await handle_update(body)
-        return JSONResponse(status_code=200, content={"ok": "true"})
+        return _static_json(_BODY_WEBHOOK_OK, 200)
     except Exception as e:
         logger.exception("webhook_handler_error")
         await send_admin_alert(f"CryptoSignal error: {type(e).__name__} at webhook")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={"ok": "false", "error": "handler_error"},
         )
@@ -1,14 +1,44 @@
 """EOD job: record outcome (WIN/LOSS/SKIP) for resolved signal runs."""
 
-from datetime import datetime, timezone
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+
+from asyncpg import Record
 
 from app.db.session import acquire
+from app.json_util import json_loads
 from app.logging_config import get_logger
-from app.outcomes.resolution import resolve_market_outcome
+from app.outcomes.resolution import (
+    fetch_close_price_from_resolution_source,
+    fetch_klines_range,
+    is_binance_resolution,
+    is_up_down_market,
+    parse_rule_from_question,
+    resolve_market_outcome,
+    resolve_outcome,
+)
 from app.polymarket.client import fetch_markets, parse_market
 
 logger = get_logger(__name__)
 
+# Max concurrent run resolutions; each does Gamma + Binance + Postgres round-trips
+EOD_CONCURRENCY = 8
+
+# Bounded hand-off between the streaming cursor and the resolution workers
+_EOD_QUEUE_MAX = EOD_CONCURRENCY * 2
+
+_UNRESOLVED_RUNS_WHERE = """
+    FROM signal_runs sr
+    JOIN market_metadata mm ON mm.condition_id = sr.market_condition_id
+    WHERE sr.outcome IS NULL
+      AND sr.market_condition_id IS NOT NULL
+      AND sr.status = 'ok'
+      AND sr.direction IN ('YES', 'NO')
+      AND mm.end_date_utc IS NOT NULL
+      AND mm.end_date_utc < NOW()
+"""
+
 
 async def record_run_outcome(
     signal_run_id: int,
@@ -44,35 +74,59 @@ async def record_run_outcome(
     )
 
 
-async def fetch_unresolved_runs() -> list[dict]:
+async def record_run_outcomes_bulk(rows: list[tuple[int, str, str | None]]) -> None:
+    """
+    Record (signal_run_id, outcome, actual_result) for many runs in one transaction:
+    one round-trip via executemany instead of one per run. Same idempotent guard
+    (outcome IS NULL) as record_run_outcome; values come from run_eod_outcomes.
+    """
+    if not rows:
+        return
+    now = datetime.now(timezone.utc)
+    async with acquire() as conn:
+        async with conn.transaction():
+            await conn.executemany(
+                """
+                UPDATE signal_runs
+                SET outcome = $2, resolved_at = $3, actual_result = $4
+                WHERE id = $1 AND outcome IS NULL
+                """,
+                [(run_id, outcome, now, actual) for run_id, outcome, actual in rows],
+            )
+    logger.info("outcomes_recorded_bulk", count=len(rows))
+
+
+async def iter_unresolved_runs() -> AsyncIterator[Record]:
     """
-    Return signal_runs that have no outcome, market has ended (end_date_utc < now),
+    Stream signal_runs that have no outcome, market has ended (end_date_utc < now),
     and direction is YES or NO (exclude NO_TRADE). Joins with market_metadata for
     resolution_source and end_date_utc. Skips runs with NULL market_condition_id.
+    Uses a server-side cursor so a large backlog is never materialized at once;
+    the connection stays checked out for the life of the iteration.
     """
     async with acquire() as conn:
-        rows = await conn.fetch(
-            """
-            SELECT sr.id, sr.run_at, sr.market_slug, sr.market_condition_id, sr.direction,
-                   mm.resolution_source, mm.end_date_utc, mm.slug AS meta_slug
-            FROM signal_runs sr
-            JOIN market_metadata mm ON mm.condition_id = sr.market_condition_id
-            WHERE sr.outcome IS NULL
-              AND sr.market_condition_id IS NOT NULL
-              AND sr.status = 'ok'
-              AND sr.direction IN ('YES', 'NO')
-              AND mm.end_date_utc IS NOT NULL
-              AND mm.end_date_utc < NOW()
-            ORDER BY sr.run_at ASC
-            """,
-        )
-    return [dict(r) for r in rows]
+        async with conn.transaction():
+            async for row in conn.cursor(
+                f"""
+                SELECT sr.id, sr.run_at, sr.market_slug, sr.market_condition_id, sr.direction,
+                       mm.resolution_source, mm.end_date_utc, mm.slug AS meta_slug,
+                       mm.question, mm.outcomes_json
+                {_UNRESOLVED_RUNS_WHERE}
+                ORDER BY sr.run_at ASC
+                """,
+            ):
+                yield row
 
 
-async def _get_question_and_outcomes_for_slug(slug: str | None) -> tuple[str | None, list[str]]:
+# Question/outcomes for a closed market never change; cache the lookup task per
+# slug so repeat runs — and concurrent duplicates within one gather — share one
+# Gamma call. Cleared wholesale if it ever grows past the cap.
+_QUESTION_CACHE_MAX = 2048
+_question_tasks: dict[str, asyncio.Task] = {}
+
+
+async def _fetch_question_and_outcomes(slug: str) -> tuple[str | None, list[str]]:
     """Fetch market from Gamma by slug (closed); return (question, outcomes_list) for resolution."""
-    if not slug:
-        return (None, [])
     try:
         data = await fetch_markets(closed=True, slug=slug, limit=1)
         if not data or not isinstance(data, list):
@@ -86,57 +140,180 @@ async def _get_question_and_outcomes_for_slug(slug: str | None) -> tuple[str | N
         return (question, outcomes)
     except Exception as e:
         logger.warning("fetch_question_failed", slug=slug, error=str(e))
+        # Don't cache transient failures; the next EOD run should retry
+        _question_tasks.pop(slug, None)
         return (slug, [])
 
 
+async def _get_question_and_outcomes_for_slug(slug: str | None) -> tuple[str | None, list[str]]:
+    """Cached wrapper around _fetch_question_and_outcomes."""
+    if not slug:
+        return (None, [])
+    task = _question_tasks.get(slug)
+    if task is None:
+        if len(_question_tasks) >= _QUESTION_CACHE_MAX:
+            _question_tasks.clear()
+        task = asyncio.create_task(_fetch_question_and_outcomes(slug))
+        _question_tasks[slug] = task
+    return await task
+
+
+def _outcomes_from_json(raw: str | None) -> list[str]:
+    """Parse cached outcomes_json ('["Up","Down"]') to a list; empty if missing/invalid."""
+    if not raw:
+        return []
+    try:
+        parsed = json_loads(raw)
+    except (ValueError, TypeError):
+        return []
+    return [str(x) for x in parsed] if isinstance(parsed, list) else []
+
+
+async def _process_run(run: Record) -> tuple[int, str, str] | None:
+    """
+    Resolve one unresolved run. Returns (run_id, outcome, actual_result) for the
+    bulk write, or None if skipped (resolution failed or unsupported). Concurrency
+    is bounded by the worker count in run_eod_outcomes.
+    """
+    run_id = run["id"]
+    direction = run["direction"]
+    resolution_source = run.get("resolution_source")
+    end_date_utc = run.get("end_date_utc")
+    market_slug = run.get("market_slug")
+
+    question_cached = run.get("question")
+    if question_cached:
+        # market_metadata carries the Gamma payload; no API round-trip needed
+        actual_result = await resolve_market_outcome(
+            resolution_source,
+            end_date_utc,
+            question_cached,
+            outcomes=_outcomes_from_json(run.get("outcomes_json")),
+        )
+    elif is_up_down_market(market_slug):
+        # Slug text already identifies an Up/Down market; skip the Gamma lookup
+        actual_result = await resolve_market_outcome(
+            resolution_source, end_date_utc, market_slug
+        )
+    else:
+        # Overlap the Gamma question lookup with the settlement-price fetch:
+        # per-run latency is max(gamma, binance) instead of the sum
+        gamma_task = asyncio.create_task(_get_question_and_outcomes_for_slug(market_slug))
+        price_task = asyncio.create_task(
+            fetch_close_price_from_resolution_source(resolution_source, end_date_utc)
+        )
+        question, outcomes = await gamma_task
+        slug_or_question = question or market_slug
+        if is_up_down_market(slug_or_question, outcomes):
+            # Resolves from the 1h candle; the daily close fetch is not needed
+            price_task.cancel()
+            actual_result = await resolve_market_outcome(
+                resolution_source, end_date_utc, slug_or_question, outcomes=outcomes
+            )
+        else:
+            rule_above, rule_below = parse_rule_from_question(slug_or_question)
+            if rule_above is None and rule_below is None:
+                price_task.cancel()
+                logger.debug(
+                    "resolve_no_rule", slug_or_question=(slug_or_question or "")[:80]
+                )
+                actual_result = None
+            else:
+                actual_result = resolve_outcome(
+                    resolution_source, await price_task, rule_above, rule_below
+                )
+    if actual_result is None:
+        logger.info(
+            "eod_skip_unresolved",
+            signal_run_id=run_id,
+            reason="resolution_failed_or_unsupported",
+        )
+        return None
+
+    # WIN if prediction matched outcome; LOSS otherwise
+    if direction == "YES" and actual_result == "YES":
+        outcome = "WIN"
+    elif direction == "NO" and actual_result == "NO":
+        outcome = "WIN"
+    else:
+        outcome = "LOSS"
+
+    return (run_id, outcome, actual_result)
+
+
+async def _prefetch_klines() -> None:
+    """
+    Prime the Binance kline cache with one ranged call per interval, so clustered
+    market dates cost one request instead of one each. Scans only the columns it
+    needs in a separate (cheap) query, since the full rows stream through a cursor.
+    """
+    async with acquire() as conn:
+        runs = await conn.fetch(
+            f"""
+            SELECT sr.market_slug, mm.resolution_source, mm.end_date_utc
+            {_UNRESOLVED_RUNS_WHERE}
+            """,
+        )
+    hour_ts: list[int] = []
+    day_ts: list[int] = []
+    for run in runs:
+        end_date_utc = run.get("end_date_utc")
+        if not end_date_utc:
+            continue
+        if end_date_utc.tzinfo is None:
+            end_date_utc = end_date_utc.replace(tzinfo=timezone.utc)
+        if is_up_down_market(run.get("market_slug")):
+            candle_start = end_date_utc - timedelta(hours=1)
+            hour_ts.append(int(candle_start.timestamp() * 1000))
+        elif is_binance_resolution(run.get("resolution_source")):
+            day = end_date_utc.date()
+            day_start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+            day_ts.append(int(day_start.timestamp() * 1000))
+    tasks = []
+    if len(hour_ts) > 1:
+        tasks.append(fetch_klines_range("BTCUSDT", "1h", min(hour_ts), max(hour_ts) + 3_599_999))
+    if len(day_ts) > 1:
+        tasks.append(fetch_klines_range("BTCUSDT", "1d", min(day_ts), max(day_ts) + 86_399_999))
+    if tasks:
+        await asyncio.gather(*tasks)
+
+
 async def run_eod_outcomes() -> dict:
     """
     EOD job: for each unresolved run whose market has ended, resolve outcome
     (fetch close from resolution source, compare to rule), set WIN/LOSS and actual_result.
+    Rows stream from a server-side cursor into a bounded queue drained by
+    EOD_CONCURRENCY workers, so wall time follows the slowest upstream and memory
+    stays flat regardless of backlog size.
     Does not overwrite existing outcomes (idempotent). Returns {"updated": int, "failed": list}.
-    Per-run failures are logged and appended to failed; loop continues.
+    Per-run failures are logged and appended to failed; other runs are unaffected.
     """
-    runs = await fetch_unresolved_runs()
-    updated = 0
+    await _prefetch_klines()
+    queue: asyncio.Queue[Record | None] = asyncio.Queue(maxsize=_EOD_QUEUE_MAX)
+    resolved: list[tuple[int, str, str]] = []
     failed: list[dict] = []
-    for run in runs:
-        run_id = run["id"]
-        direction = run["direction"]
-        resolution_source = run.get("resolution_source")
-        end_date_utc = run.get("end_date_utc")
-        market_slug = run.get("market_slug")
 
-        try:
-            slug_or_question = market_slug
-            question, outcomes = await _get_question_and_outcomes_for_slug(market_slug)
-            if question:
-                slug_or_question = question
-
-            actual_result = await resolve_market_outcome(
-                resolution_source,
-                end_date_utc,
-                slug_or_question,
-                outcomes=outcomes,
-            )
-            if actual_result is None:
-                logger.info(
-                    "eod_skip_unresolved",
-                    signal_run_id=run_id,
-                    reason="resolution_failed_or_unsupported",
-                )
-                continue
-
-            # WIN if prediction matched outcome; LOSS otherwise
-            if direction == "YES" and actual_result == "YES":
-                outcome = "WIN"
-            elif direction == "NO" and actual_result == "NO":
-                outcome = "WIN"
+    async def _worker() -> None:
+        while True:
+            run = await queue.get()
+            if run is None:
+                return
+            try:
+                result = await _process_run(run)
+            except Exception as e:
+                logger.warning("eod_run_failed", signal_run_id=run["id"], error=str(e))
+                failed.append({"run_id": run["id"], "error": str(e)})
             else:
-                outcome = "LOSS"
-
-            await record_run_outcome(run_id, outcome, actual_result=actual_result)
-            updated += 1
-        except Exception as e:
-            logger.warning("eod_run_failed", signal_run_id=run_id, error=str(e))
-            failed.append({"run_id": run_id, "error": str(e)})
-    return {"updated": updated, "failed": failed}
+                if result is not None:
+                    resolved.append(result)
+
+    workers = [asyncio.create_task(_worker()) for _ in range(EOD_CONCURRENCY)]
+    try:
+        async for run in iter_unresolved_runs():
+            await queue.put(run)
+    finally:
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    await record_run_outcomes_bulk(resolved)
+    return {"updated": len(resolved), "failed": failed}
@@ -1,11 +1,12 @@
 """Resolve market outcome from resolution source (e.g. Binance close at 23:59 UTC or 1h candle)."""
 
 import re
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Literal
-
-import httpx
+from typing import Any, Literal
 
+from app.http_client import get_binance_client
+from app.json_util import json_loads
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -13,14 +14,31 @@ logger = get_logger(__name__)
 # Binance klines base URL
 BINANCE_KLINES = "https://api.binance.com/api/v3/klines"
 
+# Completed candles don't change; cache them so EOD runs resolving many markets
+# on the same day/hour make one Binance call, staying clear of request-weight limits
+_KLINE_CACHE_TTL = 3600.0
+_kline_cache: dict[tuple[str, str, int], tuple[float, list[Any]]] = {}
+
+# Strike rule, compiled once as a single alternation so the question/slug is
+# scanned in one pass instead of once per variant; parse_rule_from_question runs
+# per unresolved run. Covers: "above $96,500", "at or above $X", ">= $X",
+# "above or equal $X" and the mirrored "below" forms. Questions and slugs are
+# ASCII, so re.ASCII keeps case folding off the Unicode tables.
+_RULE_RE = re.compile(
+    r"(?:at\s+or\s+above|>=|above(?:\s+or\s+equal)?)\s*\$?\s*(?P<above>[\d,]+)"
+    r"|(?:at\s+or\s+below|<=|below(?:\s+or\s+equal)?)\s*\$?\s*(?P<below>[\d,]+)",
+    re.IGNORECASE | re.ASCII,
+)
+# "up or down", "up/down", "up-or-down"
+_UPDOWN_RE = re.compile(r"up(?:\s+or\s+|/|-or-)down", re.IGNORECASE | re.ASCII)
+
 
 def is_up_down_market(slug_or_question: str | None, outcomes: list[str] | None = None) -> bool:
     """True if market is Up/Down (1h candle direction). Detect via outcomes or question/slug text."""
     if outcomes is not None and len(outcomes) >= 2:
         if outcomes[0].strip().lower() == "up" and outcomes[1].strip().lower() == "down":
             return True
-    text = (slug_or_question or "").strip().lower()
-    return "up or down" in text or "up/down" in text or "up-or-down" in text
+    return _UPDOWN_RE.search(slug_or_question or "") is not None
 
 
 def _parse_number(group: str) -> float | None:
@@ -40,31 +58,15 @@ def parse_rule_from_question(slug_or_question: str | None) -> tuple[float | None
     """
     if not slug_or_question:
         return (None, None)
-    text = (slug_or_question or "").strip()
-    # Above: "above $96,500", "at or above $X", ">= $X", "above or equal $X"
-    above_patterns = [
-        r"at\s+or\s+above\s+\$?\s*([\d,]+)",
-        r">=\s*\$?\s*([\d,]+)",
-        r"above\s+or\s+equal\s+\$?\s*([\d,]+)",
-        r"above\s+\$?\s*([\d,]+)",
-    ]
-    for pat in above_patterns:
-        m = re.search(pat, text, re.IGNORECASE)
-        if m:
-            val = _parse_number(m.group(1))
+    m = _RULE_RE.search((slug_or_question or "").strip())
+    if m:
+        above = m.group("above")
+        if above is not None:
+            val = _parse_number(above)
             if val is not None:
                 return (val, None)
-    # Below: "below $97,000", "at or below $X", "<= $X", "below or equal $X"
-    below_patterns = [
-        r"at\s+or\s+below\s+\$?\s*([\d,]+)",
-        r"<=\s*\$?\s*([\d,]+)",
-        r"below\s+or\s+equal\s+\$?\s*([\d,]+)",
-        r"below\s+\$?\s*([\d,]+)",
-    ]
-    for pat in below_patterns:
-        m = re.search(pat, text, re.IGNORECASE)
-        if m:
-            val = _parse_number(m.group(1))
+        else:
+            val = _parse_number(m.group("below"))
             if val is not None:
                 return (None, val)
     return (None, None)
@@ -89,41 +91,98 @@ def resolve_outcome(
     return None
 
 
-async def fetch_1h_open_close_binance(candle_start_utc: datetime) -> tuple[float, float] | None:
+async def _fetch_first_kline(interval: str, start_ts: int, symbol: str = "BTCUSDT") -> list | None:
     """
-    Fetch 1h candle open and close from Binance for the given candle start time.
-    Returns (open, close) or None on error.
+    Fetch the first kline for (symbol, interval, startTime), TTL-cached.
+    Returns the raw candle list or None on error / empty response.
     """
-    if candle_start_utc.tzinfo is None:
-        candle_start_utc = candle_start_utc.replace(tzinfo=timezone.utc)
-    start_ts = int(candle_start_utc.timestamp() * 1000)
+    key = (symbol, interval, start_ts)
+    cached = _kline_cache.get(key)
+    now = time.monotonic()
+    if cached is not None and now < cached[0]:
+        return cached[1]
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                BINANCE_KLINES,
-                params={
-                    "symbol": "BTCUSDT",
-                    "interval": "1h",
-                    "startTime": start_ts,
-                    "limit": 1,
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await get_binance_client().get(
+            BINANCE_KLINES,
+            params={
+                "symbol": symbol,
+                "interval": interval,
+                "startTime": start_ts,
+                "limit": 1,
+            },
+        )
+        resp.raise_for_status()
+        data = json_loads(resp.content)
     except Exception as e:
         logger.warning(
-            "binance_1h_fetch_failed",
-            candle_start=candle_start_utc.isoformat(),
+            "binance_kline_fetch_failed",
+            interval=interval,
+            start_ts=start_ts,
             error=str(e),
         )
         return None
     if not data or not isinstance(data, list) or len(data) < 1:
         return None
-    # Kline: [open_time, open, high, low, close, ...]
     candle = data[0]
+    _kline_cache[key] = (now + _KLINE_CACHE_TTL, candle)
+    return candle
+
+
+async def fetch_klines_range(symbol: str, interval: str, start_ts: int, end_ts: int) -> int:
+    """
+    Fetch up to 1000 klines for [start_ts, end_ts] in one call and prime the kline
+    cache per candle start, so per-run resolvers hit the cache instead of Binance.
+    Spans beyond 1000 candles are truncated by Binance; the tail falls back to
+    per-candle fetches. Returns the number of candles cached (0 on error).
+    """
+    try:
+        resp = await get_binance_client().get(
+            BINANCE_KLINES,
+            params={
+                "symbol": symbol,
+                "interval": interval,
+                "startTime": start_ts,
+                "endTime": end_ts,
+                "limit": 1000,
+            },
+        )
+        resp.raise_for_status()
+        data = json_loads(resp.content)
+    except Exception as e:
+        logger.warning(
+            "binance_klines_range_fetch_failed",
+            interval=interval,
+            start_ts=start_ts,
+            end_ts=end_ts,
+            error=str(e),
+        )
+        return 0
+    if not isinstance(data, list):
+        return 0
+    expires_at = time.monotonic() + _KLINE_CACHE_TTL
+    for candle in data:
+        try:
+            open_time = int(candle[0])
+        except (IndexError, TypeError, ValueError):
+            continue
+        _kline_cache[(symbol, interval, open_time)] = (expires_at, candle)
+    return len(data)
+
+
+async def fetch_1h_open_close_binance(candle_start_utc: datetime) -> tuple[float, float] | None:
+    """
+    Fetch 1h candle open and close from Binance for the given candle start time.
+    Returns (open, close) or None on error.
+    """
+    if candle_start_utc.tzinfo is None:
+        candle_start_utc = candle_start_utc.replace(tzinfo=timezone.utc)
+    start_ts = int(candle_start_utc.timestamp() * 1000)
+    candle = await _fetch_first_kline("1h", start_ts)
+    if candle is None:
+        return None
+    # Kline: [open_time, open, high, low, close, ...]
     try:
-        open_p = float(candle[1])
-        close_p = float(candle[4])
+        open_p, close_p = float(candle[1]), float(candle[4])
     except (IndexError, TypeError, ValueError):
         return None
     return (open_p, close_p)
@@ -153,29 +212,13 @@ async def fetch_close_price_binance_utc(end_date_utc: datetime) -> float | None:
         end_date_utc = end_date_utc.replace(tzinfo=timezone.utc)
     day = end_date_utc.date()
     start_ts = int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp() * 1000)
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(
-                BINANCE_KLINES,
-                params={
-                    "symbol": "BTCUSDT",
-                    "interval": "1d",
-                    "startTime": start_ts,
-                    "limit": 1,
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
-    except Exception as e:
-        logger.warning("binance_close_fetch_failed", end_date=day.isoformat(), error=str(e))
-        return None
-    if not data or not isinstance(data, list) or len(data) < 1:
+    candle = await _fetch_first_kline("1d", start_ts)
+    if candle is None:
         return None
     # Kline: [open_time, open, high, low, close, ...]
-    close = data[0][4]
     try:
-        return float(close)
-    except (TypeError, ValueError):
+        return float(candle[4])
+    except (IndexError, TypeError, ValueError):
         return None
 
 
@@ -1,13 +1,20 @@
 """Async client for Gamma API (markets) and CLOB (order book)."""
 
-import json
+from itertools import pairwise
+from operator import itemgetter
 from typing import Any, Literal
 
-import httpx
 from app.config import get_settings
+from app.http_client import get_clob_client, get_gamma_client
+from app.json_util import json_loads
 from app.logging_config import get_logger
 from app.polymarket.models import Market, OrderBook, OrderBookLevel, UpDownMarket
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - only hit when numpy is not installed
+    np = None
+
 logger = get_logger(__name__)
 
 GAMMA_BASE = "https://gamma-api.polymarket.com"
@@ -27,18 +34,21 @@ async def fetch_markets(
     limit: int = 100,
     slug: str | None = None,
     end_date_min: str | None = None,
+    tag_id: str | None = None,
 ) -> list[dict[str, Any]]:
-    """Fetch markets from Gamma API. Filter by query params."""
+    """Fetch markets from Gamma API. Filter by query params (tag_id narrows server-side)."""
     params: dict[str, Any] = {"closed": str(closed).lower(), "limit": limit}
     if slug:
         params["slug"] = slug
     if end_date_min:
         params["end_date_min"] = end_date_min
-    headers = _polymarket_headers()
-    async with httpx.AsyncClient(timeout=15.0, headers=headers) as client:
-        resp = await client.get(f"{GAMMA_BASE}/markets", params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    if tag_id:
+        params["tag_id"] = tag_id
+    resp = await get_gamma_client().get(
+        f"{GAMMA_BASE}/markets", params=params, headers=_polymarket_headers()
+    )
+    resp.raise_for_status()
+    data = json_loads(resp.content)
     return data if isinstance(data, list) else []
 
 
@@ -81,6 +91,13 @@ def parse_market(raw: dict[str, Any]) -> Market | None:
         return None
 
 
+def _is_monotone(levels: list[tuple[float, float]], descending: bool) -> bool:
+    """True if level prices are already in the wanted order (CLOB usually sends them sorted)."""
+    if descending:
+        return all(a[0] >= b[0] for a, b in pairwise(levels))
+    return all(a[0] <= b[0] for a, b in pairwise(levels))
+
+
 def parse_order_book(data: dict[str, Any]) -> OrderBook:
     """
     Parse CLOB response dict into OrderBook. Bids sorted desc, asks asc.
@@ -88,24 +105,27 @@ def parse_order_book(data: dict[str, Any]) -> OrderBook:
     """
     raw_bids = data.get("bids") or []
     raw_asks = data.get("asks") or []
-    bids = sorted(
-        [
-            OrderBookLevel(price=float(b.get("price", 0)), size=float(b.get("size", 0)))
-            for b in raw_bids
-        ],
-        key=lambda x: x.price,
-        reverse=True,
-    )
-    asks = sorted(
-        [
-            OrderBookLevel(price=float(a.get("price", 0)), size=float(a.get("size", 0)))
-            for a in raw_asks
-        ],
-        key=lambda x: x.price,
-    )
-    best_bid = bids[0].price if bids else None
-    best_ask = asks[0].price if asks else None
-    return OrderBook(bids=bids, asks=asks, best_bid=best_bid, best_ask=best_ask)
+    # Sort plain tuples, then build levels for the retained order only:
+    # per-level Pydantic validation on already-coerced floats is pure overhead
+    bid_tuples = [(float(b.get("price", 0)), float(b.get("size", 0))) for b in raw_bids]
+    ask_tuples = [(float(a.get("price", 0)), float(a.get("size", 0))) for a in raw_asks]
+    if not _is_monotone(bid_tuples, descending=True):
+        bid_tuples.sort(key=itemgetter(0), reverse=True)
+    if not _is_monotone(ask_tuples, descending=False):
+        ask_tuples.sort(key=itemgetter(0))
+    bids = [OrderBookLevel(p, s) for p, s in bid_tuples]
+    asks = [OrderBookLevel(p, s) for p, s in ask_tuples]
+    best_bid = bid_tuples[0][0] if bid_tuples else None
+    best_ask = ask_tuples[0][0] if ask_tuples else None
+    book = OrderBook(bids=bids, asks=asks, best_bid=best_bid, best_ask=best_ask)
+    if np is not None:
+        # SoA mirrors for vectorized depth math (see models.OrderBook)
+        n_bids, n_asks = len(bid_tuples), len(ask_tuples)
+        book.bid_prices = np.fromiter((p for p, _ in bid_tuples), np.float64, count=n_bids)
+        book.bid_sizes = np.fromiter((s for _, s in bid_tuples), np.float64, count=n_bids)
+        book.ask_prices = np.fromiter((p for p, _ in ask_tuples), np.float64, count=n_asks)
+        book.ask_sizes = np.fromiter((s for _, s in ask_tuples), np.float64, count=n_asks)
+    return book
 
 
 async def fetch_order_book(token_id: str) -> OrderBook:
@@ -113,11 +133,11 @@ async def fetch_order_book(token_id: str) -> OrderBook:
     Fetch order book for one token (YES side) from CLOB.
     GET /book?token_id=...
     """
-    headers = _polymarket_headers()
-    async with httpx.AsyncClient(timeout=10.0, headers=headers) as client:
-        resp = await client.get(f"{CLOB_BASE}/book", params={"token_id": token_id})
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await get_clob_client().get(
+        f"{CLOB_BASE}/book", params={"token_id": token_id}, headers=_polymarket_headers()
+    )
+    resp.raise_for_status()
+    data = json_loads(resp.content)
     return parse_order_book(data)
 
 
@@ -134,11 +154,11 @@ async def fetch_events_by_series_id(
         "closed": str(closed).lower(),
         "limit": limit,
     }
-    headers = _polymarket_headers()
-    async with httpx.AsyncClient(timeout=15.0, headers=headers) as client:
-        resp = await client.get(f"{GAMMA_BASE}/events", params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await get_gamma_client().get(
+        f"{GAMMA_BASE}/events", params=params, headers=_polymarket_headers()
+    )
+    resp.raise_for_status()
+    data = json_loads(resp.content)
     return data if isinstance(data, list) else []
 
 
@@ -147,7 +167,7 @@ def _parse_outcomes_and_token_ids(raw: dict[str, Any]) -> tuple[list[str], list[
     outcomes_raw = raw.get("outcomes")
     if isinstance(outcomes_raw, str):
         try:
-            outcomes = json.loads(outcomes_raw)
+            outcomes = json_loads(outcomes_raw)
         except (TypeError, ValueError):
             outcomes = []
     elif isinstance(outcomes_raw, list):
@@ -211,11 +231,13 @@ def parse_updown_market(
 
 async def fetch_clob_price(token_id: str, side: Literal["buy", "sell"]) -> float | None:
     """Fetch CLOB price for one token. GET /price?token_id=...&side=buy|sell."""
-    headers = _polymarket_headers()
-    async with httpx.AsyncClient(timeout=10.0, headers=headers) as client:
-        resp = await client.get(f"{CLOB_BASE}/price", params={"token_id": token_id, "side": side})
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await get_clob_client().get(
+        f"{CLOB_BASE}/price",
+        params={"token_id": token_id, "side": side},
+        headers=_polymarket_headers(),
+    )
+    resp.raise_for_status()
+    data = json_loads(resp.content)
     price = data.get("price")
     if price is None:
         return None
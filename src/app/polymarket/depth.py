@@ -3,6 +3,28 @@
 from app.config import get_settings
 from app.polymarket.models import OrderBook
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - only hit when numpy is not installed
+    np = None
+
+# Below this depth the NumPy array setup costs more than the Python loop saves
+_VECTOR_MIN_LEVELS = 8
+
+
+def _max_safe_size_usd_vectorized(prices, sizes, best: float, side: str, limit: float) -> float:
+    """NumPy path: prefix sums + one broadcast compare instead of a Python loop per level."""
+    n = len(prices)
+    cum_usd = np.cumsum(prices * sizes)
+    cum_shares = np.cumsum(sizes)
+    sign = 1.0 if side == "ask" else -1.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slippage = sign * (cum_usd / cum_shares - best) / best
+    exceeds = slippage > limit
+    # Stop before the first level that pushes slippage over the limit
+    idx = int(exceeds.argmax()) if exceeds.any() else n
+    return round(float(cum_usd[idx - 1]), 2) if idx > 0 else 0.0
+
 
 def max_safe_size_usd(book: OrderBook, side: str = "ask") -> float:
     """
@@ -15,24 +37,30 @@ def max_safe_size_usd(book: OrderBook, side: str = "ask") -> float:
     if side == "ask":
         levels = book.asks
         best = book.best_ask
+        prices, sizes = book.ask_prices, book.ask_sizes
     else:
         levels = book.bids
         best = book.best_bid
+        prices, sizes = book.bid_prices, book.bid_sizes
     if not levels or best is None or best <= 0:
         return 0.0
+    if np is not None and (prices is not None or len(levels) >= _VECTOR_MIN_LEVELS):
+        if prices is None:
+            n = len(levels)
+            prices = np.fromiter((level.price for level in levels), np.float64, count=n)
+            sizes = np.fromiter((level.size for level in levels), np.float64, count=n)
+        return _max_safe_size_usd_vectorized(prices, sizes, best, side, limit)
     cumulative_usd = 0.0
     cumulative_shares = 0.0
+    # Hoist the side branch: slippage is (avg - best)/best for asks, negated for bids
+    sign = 1.0 if side == "ask" else -1.0
     for level in levels:
         price = level.price
         size = level.size
-        # Slippage vs best: (avg_price - best) / best for asks
         new_shares = cumulative_shares + size
         new_usd = cumulative_usd + price * size
         avg_price = new_usd / new_shares if new_shares > 0 else price
-        if side == "ask":
-            slippage = (avg_price - best) / best if best else 0
-        else:
-            slippage = (best - avg_price) / best if best else 0
+        slippage = sign * (avg_price - best) / best
         if slippage > limit:
             # Stop before this level; interpolate or use previous
             break
@@ -1,9 +1,10 @@
 """Pydantic models for Polymarket market and order book."""
 
-import json
-from typing import Any
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from app.json_util import json_loads
 
 
 class Market(BaseModel):
@@ -24,21 +25,21 @@ class Market(BaseModel):
     liquidity_num: float | None = Field(None, alias="liquidityNum")
     outcomes_raw: str | None = Field(None, alias="outcomes")
     event_start_time: str | None = Field(None, alias="eventStartTime")
+    outcomes_list: list[str] = Field(default_factory=list)
 
     model_config = {"populate_by_name": True, "extra": "ignore"}
 
-    @property
-    def outcomes_list(self) -> list[str]:
-        """Parse outcomes_raw JSON string to list; empty if missing or invalid."""
-        if not self.outcomes_raw:
-            return []
-        try:
-            parsed: Any = json.loads(self.outcomes_raw)
-            if isinstance(parsed, list) and all(isinstance(x, str) for x in parsed):
-                return parsed
-            return []
-        except (json.JSONDecodeError, TypeError):
-            return []
+    @model_validator(mode="after")
+    def _parse_outcomes(self) -> "Market":
+        """Parse outcomes_raw JSON string to list once; empty if missing or invalid."""
+        if not self.outcomes_list and self.outcomes_raw:
+            try:
+                parsed: Any = json_loads(self.outcomes_raw)
+                if isinstance(parsed, list) and all(isinstance(x, str) for x in parsed):
+                    self.outcomes_list = parsed
+            except (ValueError, TypeError):
+                pass
+        return self
 
     @property
     def yes_label(self) -> str | None:
@@ -53,8 +54,8 @@ class Market(BaseModel):
         return lst[1] if len(lst) >= 2 else None
 
 
-class OrderBookLevel(BaseModel):
-    """Single price level (price, size)."""
+class OrderBookLevel(NamedTuple):
+    """Single price level (price, size). Plain tuple: books carry hundreds of these."""
 
     price: float
     size: float  # in shares or USD depending on API
@@ -67,6 +68,15 @@ class OrderBook(BaseModel):
     asks: list[OrderBookLevel] = Field(default_factory=list)
     best_bid: float | None = None
     best_ask: float | None = None
+    # SoA mirrors of the sorted levels (float64 ndarrays, set by parse_order_book
+    # when NumPy is available) so depth math runs over contiguous arrays instead
+    # of per-level objects. Typed Any to keep numpy out of this module.
+    bid_prices: Any | None = Field(default=None, exclude=True)
+    bid_sizes: Any | None = Field(default=None, exclude=True)
+    ask_prices: Any | None = Field(default=None, exclude=True)
+    ask_sizes: Any | None = Field(default=None, exclude=True)
+
+    model_config = {"arbitrary_types_allowed": True}
 
     @property
     def spread(self) -> float | None:
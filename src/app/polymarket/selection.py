@@ -1,40 +1,71 @@
 """Select active daily or hourly BTC market (prefer next upcoming hourly Up/Down)."""
 
-import re
+import heapq
+import time
 from datetime import date, datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any
 
+from app.config import get_settings
 from app.logging_config import get_logger
 from app.polymarket.client import fetch_markets, parse_market
 from app.polymarket.models import Market
 
 logger = get_logger(__name__)
 
-# Slug patterns for BTC daily (e.g. "bitcoin-above-96500-on-january-30" or "btc-daily-...")
-BTC_DAILY_PATTERNS = (
-    re.compile(r"bitcoin.*(?:above|below|close|daily)", re.I),
-    re.compile(r"btc.*(?:above|below|close|daily)", re.I),
-    re.compile(r"daily.*bitcoin", re.I),
-)
+# Sort-key sentinel for markets with no usable timestamp (sorts last)
+_DT_MAX_UTC = datetime.max.replace(tzinfo=timezone.utc)
 
-# Slug patterns for BTC hourly Up/Down (e.g. "bitcoin-up-or-down-january-31-2pm-et" or "up or down")
-BTC_UP_DOWN_HOURLY_PATTERNS = (
-    re.compile(r"bitcoin.*up.*down", re.I),
-    re.compile(r"bitcoin.*up\s*or\s*down", re.I),
-    re.compile(r"btc.*up.*down", re.I),
-    re.compile(r"btc.*up\s*or\s*down", re.I),
-)
+# Slug matching uses plain substring tests: the tokens are literal ASCII
+# ("bitcoin", "up", "daily", ...) so `in` does the same job as the old regex
+# alternations without the engine overhead, and most of the 200-market Gamma
+# page is rejected on the first check.
+
+# Keywords for BTC daily (e.g. "bitcoin-above-96500-on-january-30" or "btc-daily-...")
+_DAILY_KEYWORDS = ("above", "below", "close", "daily")
 
 
 def _is_btc_daily_slug(slug: str | None) -> bool:
     if not slug:
         return False
-    return any(p.search(slug) for p in BTC_DAILY_PATTERNS)
+    s = slug.lower()
+    return ("bitcoin" in s or "btc" in s) and any(k in s for k in _DAILY_KEYWORDS)
 
 
 def _is_btc_up_down_hourly_slug(slug: str | None) -> bool:
+    # e.g. "bitcoin-up-or-down-january-31-2pm-et"
     if not slug:
         return False
-    return any(p.search(slug) for p in BTC_UP_DOWN_HOURLY_PATTERNS)
+    s = slug.lower()
+    return ("bitcoin" in s or "btc" in s) and "up" in s and "down" in s
+
+
+# Memoize "what is the current market" answers briefly: several subsystems
+# (signal engine, fetchers, formatter) ask within the same loop iteration, and
+# each uncached call costs a Gamma page fetch + parse. Only the implicit
+# "now" call shape is cached; explicit now_utc/for_date stays deterministic.
+_SELECT_CACHE_TTL = 60.0
+_select_cache: dict[tuple[str, str | None], tuple[float, Market]] = {}
+
+
+def _select_cache_get(key: tuple[str, str | None]) -> Market | None:
+    hit = _select_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < _SELECT_CACHE_TTL:
+        return hit[1]
+    return None
+
+
+def _btc_page_filters() -> dict[str, Any]:
+    """
+    Query kwargs for BTC market pages. When POLYMARKET_BTC_TAG_ID is configured,
+    Gamma pre-filters to BTC server-side and a much smaller page suffices;
+    otherwise fall back to the broad 200-market page filtered client-side.
+    """
+    tag_id = get_settings().polymarket_btc_tag_id
+    if tag_id:
+        return {"limit": 25, "tag_id": tag_id}
+    return {"limit": 200}
 
 
 def is_btc_up_down_hourly_market(market: Market) -> bool:
@@ -44,52 +75,94 @@ def is_btc_up_down_hourly_market(market: Market) -> bool:
 
 def _is_active_and_open(m: Market) -> bool:
     """Market is not closed; treat active/enable_order_book missing as OK (Gamma can omit them)."""
-    if m.closed is True:
-        return False
-    if m.active is False:
-        return False
-    if m.enable_order_book is False:
-        return False
-    return True
+    return not m.closed and m.active is not False and m.enable_order_book is not False
+
+
+@lru_cache(maxsize=512)
+def _parse_iso_utc(raw: str) -> datetime | None:
+    """
+    Parse ISO date string (e.g. 2026-01-30T23:59:59Z) to aware UTC datetime; None if invalid.
+    Cached: each market's end/start strings get parsed by the filter, the live/upcoming
+    checks, and the sort keys, so identical strings parse once per selection call.
+    fromisoformat handles the trailing Z natively on Python 3.11+ (our floor).
+    Callers pass real strings (Market fields are typed str | None), so only
+    malformed content — ValueError — needs catching.
+    """
+    try:
+        dt = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _raw_is_open(r: dict) -> bool:
+    """
+    Cheap pre-parse check on raw Gamma fields (camelCase keys), mirroring
+    _is_active_and_open so rejected rows never pay for Market construction.
+    Missing fields are treated as OK, same as the model-level check.
+    """
+    return (
+        r.get("closed") is not True
+        and r.get("active") is not False
+        and r.get("enableOrderBook") is not False
+    )
 
 
 def _end_date_after(m: Market, d: date) -> bool:
     """Market end date is on or after d (UTC)."""
     if not m.end_date:
         return True
-    try:
-        # ISO format e.g. 2026-01-30T23:59:59Z
-        end = datetime.fromisoformat(m.end_date.replace("Z", "+00:00"))
-        return end.date() >= d
-    except Exception:
+    end = _parse_iso_utc(m.end_date)
+    if end is None:
         return True
+    return end.date() >= d
 
 
 async def select_btc_daily_market(for_date: date | None = None) -> Market | None:
     """
     Select the active daily BTC market for the given date (default: today UTC).
     Returns first matching market: BTC daily slug, active, open, end_date >= for_date.
+    The default-date call shape is cached for 60s to coalesce repeat callers.
     """
-    for_date = for_date or date.today()
+    if for_date is None:
+        key = ("daily", None)
+        cached = _select_cache_get(key)
+        if cached is not None:
+            return cached
+        market = await _select_btc_daily_market(date.today())
+        if market is not None:
+            _select_cache[key] = (time.monotonic(), market)
+        return market
+    return await _select_btc_daily_market(for_date)
+
+
+async def _select_btc_daily_market(for_date: date) -> Market | None:
     end_min = for_date.isoformat() + "T00:00:00Z"
-    raw = await fetch_markets(closed=False, limit=200, end_date_min=end_min)
+    raw = await fetch_markets(closed=False, end_date_min=end_min, **_btc_page_filters())
+    candidates = _collect_daily_candidates(raw, for_date)
+    return candidates[0] if candidates else None
+
+
+def _collect_daily_candidates(raw: list, for_date: date) -> list[Market]:
+    """Filter raw Gamma markets to daily BTC candidates, sorted by end_date (soonest first)."""
     candidates: list[Market] = []
     for r in raw:
-        m = parse_market(r)
-        if not m or not m.condition_id:
+        # Cheap raw-dict checks first: rejects most of the page before model construction
+        if not _is_btc_daily_slug(r.get("slug")):
             continue
-        if not _is_btc_daily_slug(m.slug):
+        if not _raw_is_open(r):
             continue
-        if not _is_active_and_open(m):
+        m = parse_market(r)
+        if not m or not m.condition_id:
             continue
         if not _end_date_after(m, for_date):
             continue
         candidates.append(m)
     # Prefer by end_date closest to for_date end-of-day
-    if not candidates:
-        return None
-    candidates.sort(key=lambda m: m.end_date or "", reverse=False)
-    return candidates[0]
+    candidates.sort(key=lambda m: m.end_date or "")
+    return candidates
 
 
 def _parse_event_start_utc(m: Market) -> datetime | None:
@@ -97,26 +170,14 @@ def _parse_event_start_utc(m: Market) -> datetime | None:
     raw = m.event_start_time
     if not raw:
         return None
-    try:
-        dt = datetime.fromisoformat(str(raw).replace("Z", "+00:00"))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
-    except (TypeError, ValueError):
-        return None
+    return _parse_iso_utc(raw)
 
 
 def _parse_end_date_utc(m: Market) -> datetime | None:
     """Parse end_date to datetime UTC; None if missing or invalid."""
     if not m.end_date:
         return None
-    try:
-        dt = datetime.fromisoformat(str(m.end_date).replace("Z", "+00:00"))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt
-    except (TypeError, ValueError):
-        return None
+    return _parse_iso_utc(m.end_date)
 
 
 def _is_hourly_market_live(m: Market, now_utc: datetime) -> bool:
@@ -145,28 +206,44 @@ def _is_hourly_market_upcoming(m: Market, now_utc: datetime) -> bool:
     return now_utc < end_dt
 
 
-def _collect_hourly_candidates(raw: list, now_utc: datetime) -> tuple[list[Market], list[Market]]:
-    """Split raw Gamma markets into live and upcoming hourly BTC Up/Down lists."""
-    live: list[Market] = []
-    upcoming: list[Market] = []
+def _collect_hourly_candidates(
+    raw: list, now_utc: datetime
+) -> tuple[list[tuple[datetime, Market]], list[tuple[datetime, Market]]]:
+    """
+    Single pass over raw Gamma markets: unsorted (sort_key, market) pairs for live
+    and upcoming hourly BTC Up/Down candidates. Live keys by end_date, upcoming by
+    event_start (falling back to end_date). Callers pick winners with min() or
+    heapq.nsmallest — only the first one or two are ever used, so a full sort is
+    wasted work.
+    """
+    live: list[tuple[datetime, Market]] = []
+    upcoming: list[tuple[datetime, Market]] = []
     slug_matched_rejected: list[str] = []
     for r in raw:
-        m = parse_market(r)
-        if not m or not m.condition_id:
-            continue
-        if not _is_btc_up_down_hourly_slug(m.slug):
+        # Cheap raw-dict checks first: rejects most of the page before model construction
+        slug = r.get("slug")
+        if not _is_btc_up_down_hourly_slug(slug):
             continue
-        if not _is_active_and_open(m):
-            slug_matched_rejected.append(f"{m.slug or '?'}(closed={m.closed},active={m.active},ob={m.enable_order_book})")
+        if not _raw_is_open(r):
+            slug_matched_rejected.append(
+                f"{slug or '?'}(closed={r.get('closed')},active={r.get('active')},ob={r.get('enableOrderBook')})"
+            )
             continue
-        end_dt = _parse_end_date_utc(m)
+        end_raw = r.get("endDate")
+        end_dt = _parse_iso_utc(end_raw) if end_raw.__class__ is str else None
         if end_dt is not None and now_utc >= end_dt:
-            slug_matched_rejected.append(f"{m.slug or '?'}(past)")
+            slug_matched_rejected.append(f"{slug or '?'}(past)")
+            continue
+        m = parse_market(r)
+        if not m or not m.condition_id:
             continue
         if _is_hourly_market_live(m, now_utc):
-            live.append(m)
+            # live implies end_dt is not None (checked in _is_hourly_market_live)
+            live.append((end_dt, m))
         elif _is_hourly_market_upcoming(m, now_utc):
-            upcoming.append(m)
+            start = _parse_event_start_utc(m)
+            key = start or end_dt or _DT_MAX_UTC
+            upcoming.append((key, m))
         else:
             slug_matched_rejected.append(f"{m.slug or '?'}(past)")
     if not live and not upcoming and slug_matched_rejected:
@@ -175,14 +252,6 @@ def _collect_hourly_candidates(raw: list, now_utc: datetime) -> tuple[list[Marke
             raw_count=len(raw),
             slug_matched_but_rejected=slug_matched_rejected[:5],
         )
-    live.sort(key=lambda m: _parse_end_date_utc(m) or datetime.max.replace(tzinfo=timezone.utc))
-    def _upcoming_sort_key(m: Market):
-        start = _parse_event_start_utc(m)
-        if start is not None:
-            return start
-        return _parse_end_date_utc(m) or datetime.max.replace(tzinfo=timezone.utc)
-
-    upcoming.sort(key=_upcoming_sort_key)
     return live, upcoming
 
 
@@ -194,11 +263,23 @@ async def select_btc_up_down_hourly_market(
     Select the current or next hourly BTC Up/Down market.
     If pinned_slug is set (e.g. from POLYMARKET_BTC_HOURLY_SLUG), try that market first when active.
     Otherwise prefers live then next upcoming.
+    The default-time call shape is cached for 60s to coalesce repeat callers; a None
+    result is never cached so retries keep hitting Gamma.
     """
-    from app.config import get_settings
-
-    now_utc = now_utc or datetime.now(timezone.utc)
     slug = (pinned_slug or "").strip() or (get_settings().polymarket_btc_hourly_slug or "").strip()
+    if now_utc is None:
+        key = ("hourly", slug or None)
+        cached = _select_cache_get(key)
+        if cached is not None:
+            return cached
+        market = await _select_btc_up_down_hourly_market(datetime.now(timezone.utc), slug)
+        if market is not None:
+            _select_cache[key] = (time.monotonic(), market)
+        return market
+    return await _select_btc_up_down_hourly_market(now_utc, slug)
+
+
+async def _select_btc_up_down_hourly_market(now_utc: datetime, slug: str) -> Market | None:
     if slug:
         raw_list = await fetch_markets(closed=False, limit=10, slug=slug)
         for r in raw_list:
@@ -211,12 +292,12 @@ async def select_btc_up_down_hourly_market(
                 return m
     # Include markets ending today or later; use start of today UTC so we don't exclude current hour
     end_min = now_utc.date().isoformat() + "T00:00:00Z"
-    raw = await fetch_markets(closed=False, limit=200, end_date_min=end_min)
+    raw = await fetch_markets(closed=False, end_date_min=end_min, **_btc_page_filters())
     live, upcoming = _collect_hourly_candidates(raw, now_utc)
     if live:
-        return live[0]
+        return min(live, key=itemgetter(0))[1]
     if upcoming:
-        return upcoming[0]
+        return min(upcoming, key=itemgetter(0))[1]
     # Log when no market so we can debug (e.g. Gamma slug/active/closed shape)
     sample_slugs = [r.get("slug") or r.get("question", "")[:40] for r in raw[:10]]
     logger.info(
@@ -237,20 +318,36 @@ async def select_btc_up_down_hourly_markets_next_n(
     """
     now_utc = now_utc or datetime.now(timezone.utc)
     end_min = now_utc.date().isoformat() + "T00:00:00Z"
-    raw = await fetch_markets(closed=False, limit=200, end_date_min=end_min)
+    raw = await fetch_markets(closed=False, end_date_min=end_min, **_btc_page_filters())
     live, upcoming = _collect_hourly_candidates(raw, now_utc)
     combined: list[Market] = []
     if live:
-        combined.append(live[0])
-    combined.extend(upcoming)
-    return combined[:n]
+        combined.append(min(live, key=itemgetter(0))[1])
+    # nsmallest is O(N log n) for small n, vs sorting the whole upcoming list
+    combined.extend(m for _, m in heapq.nsmallest(n - len(combined), upcoming, key=itemgetter(0)))
+    return combined
 
 
 async def select_btc_market(now_utc: datetime | None = None) -> Market | None:
     """
     Prefer next upcoming hourly Up/Down market; fall back to daily BTC market.
+    Both classifications run over one shared Gamma page, so the daily fallback
+    costs no second fetch. A pinned hourly slug still goes through the hourly
+    selector (it needs the slug-targeted lookup).
     """
-    market = await select_btc_up_down_hourly_market(now_utc)
-    if market is not None:
-        return market
-    return await select_btc_daily_market(now_utc.date() if now_utc else None)
+    pinned = (get_settings().polymarket_btc_hourly_slug or "").strip()
+    if pinned:
+        market = await select_btc_up_down_hourly_market(now_utc)
+        if market is not None:
+            return market
+        return await select_btc_daily_market(now_utc.date() if now_utc else None)
+    now_utc = now_utc or datetime.now(timezone.utc)
+    end_min = now_utc.date().isoformat() + "T00:00:00Z"
+    raw = await fetch_markets(closed=False, end_date_min=end_min, **_btc_page_filters())
+    live, upcoming = _collect_hourly_candidates(raw, now_utc)
+    if live:
+        return min(live, key=itemgetter(0))[1]
+    if upcoming:
+        return min(upcoming, key=itemgetter(0))[1]
+    daily = _collect_daily_candidates(raw, now_utc.date())
+    return daily[0] if daily else None
@@ -1,6 +1,7 @@
 """Select active BTC 15m Up/Down market by series ID (Gamma events)."""
 
 import asyncio
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
 from app.polymarket.client import (
@@ -11,6 +12,7 @@ from app.polymarket.client import (
 )
 from app.polymarket.depth import max_safe_size_usd
 from app.polymarket.models import UpDownMarket, UpDownQuote
+from app.polymarket.selection import _parse_iso_utc
 from app.config import get_settings
 from app.logging_config import get_logger
 
@@ -27,64 +29,88 @@ def flatten_event_markets(events: list[dict]) -> list[dict]:
     return out
 
 
+# Cumulative days before each month (index 1-12), non-leap year
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
+# Days from 0001-01-01 to the Unix epoch (datetime(1970, 1, 1).toordinal() - 1)
+_EPOCH_ORDINAL_OFFSET = 719162
+
+
 def _safe_time_ms(value: str | None) -> int | None:
-    """Parse ISO date string to Unix ms; None if missing or invalid."""
+    """
+    Parse ISO date string to Unix ms; None if missing or invalid.
+    Fast path for the exact Gamma shape 'YYYY-MM-DDTHH:MM:SSZ': pure integer
+    arithmetic, no intermediate datetime. Anything else falls back to fromisoformat.
+    """
     if not value:
         return None
-    try:
-        # Handle Z suffix
-        s = value.replace("Z", "+00:00")
-        dt = datetime.fromisoformat(s)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return int(dt.timestamp() * 1000)
-    except (ValueError, TypeError):
+    # Raw Gamma dicts occasionally carry non-str values; normalize once, cheaply
+    s = value if value.__class__ is str else str(value)
+    if len(s) == 20 and s[19] == "Z" and s[4] == "-" and s[7] == "-" and s[10] == "T":
+        try:
+            y = int(s[0:4])
+            mo = int(s[5:7])
+            d = int(s[8:10])
+            h = int(s[11:13])
+            mi = int(s[14:16])
+            sec = int(s[17:19])
+        except ValueError:
+            return _safe_time_ms_slow(s)
+        if not (1 <= mo <= 12 and 1 <= d <= 31 and h < 24 and mi < 60 and sec < 60):
+            return _safe_time_ms_slow(s)
+        yy = y - 1
+        days = (
+            yy * 365 + yy // 4 - yy // 100 + yy // 400
+            + _DAYS_BEFORE_MONTH[mo] + (d - 1) - _EPOCH_ORDINAL_OFFSET
+        )
+        if mo > 2 and y % 4 == 0 and (y % 100 != 0 or y % 400 == 0):
+            days += 1
+        return (days * 86400 + h * 3600 + mi * 60 + sec) * 1000
+    return _safe_time_ms_slow(s)
+
+
+def _safe_time_ms_slow(value: str) -> int | None:
+    dt = _parse_iso_utc(value)
+    if dt is None:
         return None
+    return int(dt.timestamp() * 1000)
 
 
 def pick_latest_live_market(
-    markets: list[dict],
+    markets: Iterable[dict],
     now: datetime | None = None,
 ) -> dict | None:
     """
     Choose the market with smallest endDate that is still in the future.
     Prefer markets already started (eventStartTime <= now); if none live, pick soonest upcoming.
+    Single pass: tracks the minimum-endDate live and upcoming rows directly, so any
+    iterable of market dicts works and no intermediate lists are built.
     """
-    if not markets:
-        return None
     now = now or datetime.now(timezone.utc)
     now_ms = int(now.timestamp() * 1000)
 
-    enriched: list[tuple[dict, int | None, int | None]] = []
+    best_live: dict | None = None
+    best_live_end = 0
+    best_upcoming: dict | None = None
+    best_upcoming_end = 0
     for m in markets:
         end_ms = _safe_time_ms(m.get("endDate") or m.get("end_date"))
+        if end_ms is None or end_ms <= now_ms:
+            continue
         start_ms = _safe_time_ms(
             m.get("eventStartTime")
             or m.get("event_start_time")
             or m.get("startTime")
             or m.get("startDate")
         )
-        if end_ms is None:
-            continue
-        enriched.append((m, end_ms, start_ms))
-
-    # Live: started and not ended
-    live = [
-        (m, end_ms, start_ms)
-        for m, end_ms, start_ms in enriched
-        if (start_ms is None or start_ms <= now_ms) and now_ms < end_ms
-    ]
-    if live:
-        live.sort(key=lambda x: x[1])  # by end_ms ascending
-        return live[0][0]
-
-    # Upcoming: not yet started
-    upcoming = [(m, end_ms, start_ms) for m, end_ms, start_ms in enriched if now_ms < end_ms]
-    if upcoming:
-        upcoming.sort(key=lambda x: x[1])
-        return upcoming[0][0]
+        if start_ms is None or start_ms <= now_ms:
+            # Live: started (or no start time) and not ended
+            if best_live is None or end_ms < best_live_end:
+                best_live, best_live_end = m, end_ms
+        elif best_upcoming is None or end_ms < best_upcoming_end:
+            best_upcoming, best_upcoming_end = m, end_ms
 
-    return None
+    return best_live if best_live is not None else best_upcoming
 
 
 async def select_btc_15m_updown_market(
@@ -115,8 +141,8 @@ async def select_btc_15m_updown_market(
     events = await fetch_events_by_series_id(
         series_id=series_id, limit=25, active=True, closed=False
     )
-    flat = flatten_event_markets(events)
-    picked = pick_latest_live_market(flat)
+    # Stream markets straight out of the events; no flattened list needed
+    picked = pick_latest_live_market(m for e in events or [] for m in e.get("markets") or [])
     if not picked:
         logger.info("select_15m_no_market", series_id=series_id)
         return None
@@ -132,12 +158,21 @@ async def build_updown_quote(market: UpDownMarket) -> UpDownQuote | None:
     Normalizes market_up_norm = up_price / (up_price + down_price).
     """
     try:
-        up_price_raw, down_price_raw, book_up, book_down = await asyncio.gather(
+        up_price_raw, down_price_raw = await asyncio.gather(
             fetch_clob_price(market.up_token_id, "buy"),
             fetch_clob_price(market.down_token_id, "buy"),
-            fetch_order_book(market.up_token_id),
-            fetch_order_book(market.down_token_id),
         )
+        if up_price_raw is None and down_price_raw is None:
+            # No quote on either side: the market is effectively absent, so the
+            # order books can't say anything useful — skip those two fetches
+            logger.info("build_updown_quote_no_prices", condition_id=market.condition_id)
+            book_up = None
+            book_down = None
+        else:
+            book_up, book_down = await asyncio.gather(
+                fetch_order_book(market.up_token_id),
+                fetch_order_book(market.down_token_id),
+            )
     except Exception as e:
         logger.warning("build_updown_quote_failed", error=str(e))
         return None
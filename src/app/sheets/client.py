@@ -1,6 +1,7 @@
 """Google Sheets client: authenticate and batchUpdate. Requires GOOGLE_APPLICATION_CREDENTIALS or env."""
 
 import os
+from functools import lru_cache
 from typing import Any
 
 from app.logging_config import get_logger
@@ -8,8 +9,14 @@ from app.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
 def _get_credentials() -> Any:
-    """Return credentials from env (path to JSON). Lazy import google-auth."""
+    """
+    Return credentials from env (path to JSON). Lazy import google-auth.
+    Cached: loading the service-account file means disk I/O, a JSON parse and
+    RSA key construction, and callers check availability before every write.
+    Use _invalidate_credentials() if the env changes (tests).
+    """
     path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
     if not path or not os.path.isfile(path):
         return None
@@ -31,6 +38,11 @@ def _get_credentials() -> Any:
         return None
 
 
+def _invalidate_credentials() -> None:
+    """Drop the cached credentials (e.g. after changing env in tests)."""
+    _get_credentials.cache_clear()
+
+
 def sheets_client_available() -> bool:
     """True if credentials and spreadsheet ID are set."""
     creds = _get_credentials()
@@ -1,9 +1,13 @@
 """Sync signal_runs from Postgres to Google Sheets in batches."""
 
+import asyncio
 import os
+import random
 from datetime import datetime
 from typing import Any
 
+from asyncpg import Record
+
 from app.db.session import acquire
 from app.logging_config import get_logger
 from app.sheets.client import _get_credentials, sheets_client_available
@@ -11,44 +15,80 @@ from app.sheets.client import _get_credentials, sheets_client_available
 logger = get_logger(__name__)
 
 BATCH_SIZE = 50
+SHEETS_RANGE = "Daily Signals!A:P"
+
+# Module-level so every sync reuses the exact same SQL text: asyncpg keys its
+# per-connection prepared-statement cache on the query string, so conn.fetch
+# skips parse/plan after the first call on each pooled connection
+_UNSYNCED_RUNS_SQL = """
+    SELECT id, run_at, market_slug, direction, model_p, market_p, edge,
+           recommended_usd, outcome, status
+    FROM signal_runs
+    WHERE id > $1
+    ORDER BY id ASC
+    LIMIT $2
+"""
+
+# Truncated exponential backoff on quota/server errors (Sheets quota is 60 req/min/user)
+_RETRY_ATTEMPTS = 5
+_RETRYABLE_STATUSES = (429, 500, 503)
 
+# High-watermark of the last run id appended to the sheet, so quiet intervals
+# skip the Sheets API call and rows are never appended twice. Seeded from
+# MAX(id) on the first sync of the process, so a restart resumes with runs
+# created afterwards instead of replaying the whole table into the sheet
+_last_synced_id: int | None = None
 
-async def fetch_recent_runs(limit: int = 100) -> list[dict[str, Any]]:
-    """Fetch recent signal_runs with outcome for Sheets rows."""
+
+async def fetch_unsynced_runs(after_id: int, limit: int = BATCH_SIZE) -> list[Record]:
+    """Fetch signal_runs newer than after_id (oldest first) for Sheets rows.
+
+    Returns asyncpg Records as-is; they support mapping-style access, so
+    copying each row into a dict would only add allocations.
+    """
     async with acquire() as conn:
-        rows = await conn.fetch(
-            """
-            SELECT id, run_at, market_slug, direction, model_p, market_p, edge,
-                   recommended_usd, outcome, status
-            FROM signal_runs
-            ORDER BY run_at DESC
-            LIMIT $1
-            """,
-            limit,
-        )
-    return [dict(r) for r in rows]
-
-
-def _run_to_row(r: dict[str, Any]) -> list[Any]:
+        return await conn.fetch(_UNSYNCED_RUNS_SQL, after_id, limit)
+
+
+# Result column: resolved outcomes keep their label, everything else is SKIP
+_OUTCOME_LABEL = {"WIN": "WIN", "LOSS": "LOSS"}
+
+
+# Confidence column, 0-based, in the rows _run_to_row emits: the same raw
+# model_p as the next column, but rendered as a percent by the sheet's number
+# format rather than a pre-formatted string
+_CONFIDENCE_COL = 4
+
+
+def _run_to_row(r: Record) -> list[Any]:
     """Convert one signal_run to sheet row: Date, Timestamp, Asset, Direction, Confidence, ..."""
     run_at = r.get("run_at")
     if isinstance(run_at, datetime):
-        date_str = run_at.strftime("%Y-%m-%d")
-        ts_str = run_at.strftime("%Y-%m-%d %H:%M:%S")
+        # One isoformat call instead of two strftime format passes; run_at is
+        # TIMESTAMPTZ, so drop tzinfo to keep the cell free of a "+00:00" suffix
+        ts_str = run_at.replace(tzinfo=None).isoformat(sep=" ", timespec="seconds")
+        date_str = ts_str[:10]
     else:
         date_str = ts_str = str(run_at) if run_at else ""
+    model_p = r.get("model_p")
+    market_p = r.get("market_p")
+    edge = r.get("edge")
+    recommended_usd = r.get("recommended_usd")
+    outcome = r.get("outcome")
     return [
         date_str,
         ts_str,
         "BTC",
         r.get("direction") or "",
-        f"{float(r['model_p']):.0%}" if r.get("model_p") is not None else "",
-        float(r["model_p"]) if r.get("model_p") is not None else "",
-        float(r["market_p"]) if r.get("market_p") is not None else "",
-        float(r["edge"]) if r.get("edge") is not None else "",
-        float(r["recommended_usd"]) if r.get("recommended_usd") is not None else "",
-        r.get("outcome") or "",
-        "WIN" if r.get("outcome") == "WIN" else ("LOSS" if r.get("outcome") == "LOSS" else "SKIP"),
+        # Confidence: raw float in the slot the formatted percent string used
+        # to occupy, keeping the column count and layout of existing rows
+        float(model_p) if model_p is not None else "",
+        float(model_p) if model_p is not None else "",
+        float(market_p) if market_p is not None else "",
+        float(edge) if edge is not None else "",
+        float(recommended_usd) if recommended_usd is not None else "",
+        outcome or "",
+        _OUTCOME_LABEL.get(outcome, "SKIP"),
         r.get("status") or "",
     ]
 
@@ -65,27 +105,99 @@ async def sync_to_sheets() -> bool:
     sheet_id = os.environ.get("SPREADSHEET_ID")
     if not creds or not sheet_id:
         return False
-    runs = await fetch_recent_runs(limit=BATCH_SIZE)
+    global _last_synced_id
+    if _last_synced_id is None:
+        async with acquire() as conn:
+            _last_synced_id = await conn.fetchval("SELECT COALESCE(MAX(id), 0) FROM signal_runs")
+        logger.info("sheets_sync_watermark_seeded", last_id=_last_synced_id)
+    runs = await fetch_unsynced_runs(_last_synced_id, limit=BATCH_SIZE)
     if not runs:
         return True
-    rows = [_run_to_row(r) for r in reversed(runs)]
-    try:
-        from googleapiclient.discovery import (
-            build,
-        )  # optional: pip install google-api-python-client
-
-        service = build("sheets", "v4", credentials=creds)
-        body = {"values": rows}
-        # Append to "Daily Signals" (or first sheet)
-        service.spreadsheets().values().append(
-            spreadsheetId=sheet_id,
-            range="Daily Signals!A:P",
-            valueInputOption="USER_ENTERED",
-            insertDataOption="INSERT_ROWS",
-            body=body,
-        ).execute()
-        logger.info("sheets_sync_ok", rows=len(rows))
-        return True
-    except Exception as e:
-        logger.warning("sheets_sync_failed", error=str(e))
-        return False
+    rows = [_run_to_row(r) for r in runs]
+    for attempt in range(_RETRY_ATTEMPTS):
+        try:
+            # googleapiclient is synchronous; run the whole round-trip in a worker
+            # thread so the event loop (DB, fetchers, webhook) keeps running
+            await asyncio.to_thread(_append_rows_blocking, creds, sheet_id, rows)
+            _last_synced_id = runs[-1]["id"]
+            logger.info("sheets_sync_ok", rows=len(rows), last_id=_last_synced_id)
+            return True
+        except Exception as e:
+            status = getattr(getattr(e, "resp", None), "status", None)
+            if status in _RETRYABLE_STATUSES and attempt < _RETRY_ATTEMPTS - 1:
+                delay = min(2.0**attempt + random.random(), 60.0)
+                logger.warning(
+                    "sheets_sync_retry", status=status, attempt=attempt + 1, delay=round(delay, 1)
+                )
+                await asyncio.sleep(delay)
+                continue
+            logger.warning("sheets_sync_failed", error=str(e))
+            return False
+    return False
+
+
+# One-shot per process: the sheet keeps the format afterwards, so re-applying
+# every sync would just burn quota
+_percent_format_applied = False
+
+
+def _apply_percent_format_blocking(service: Any, sheet_id: str) -> None:
+    """Format the Confidence column as a percent so rows can carry raw floats."""
+    meta = service.spreadsheets().get(spreadsheetId=sheet_id, fields="sheets.properties").execute()
+    sheets = meta.get("sheets") or []
+    grid_id = None
+    for s in sheets:
+        props = s.get("properties") or {}
+        if props.get("title") == "Daily Signals":
+            grid_id = props.get("sheetId")
+            break
+    if grid_id is None and sheets:
+        grid_id = (sheets[0].get("properties") or {}).get("sheetId")
+    if grid_id is None:
+        return
+    service.spreadsheets().batchUpdate(
+        spreadsheetId=sheet_id,
+        body={
+            "requests": [
+                {
+                    "repeatCell": {
+                        "range": {
+                            "sheetId": grid_id,
+                            "startColumnIndex": _CONFIDENCE_COL,
+                            "endColumnIndex": _CONFIDENCE_COL + 1,
+                        },
+                        "cell": {
+                            "userEnteredFormat": {
+                                "numberFormat": {"type": "PERCENT", "pattern": "0%"}
+                            }
+                        },
+                        "fields": "userEnteredFormat.numberFormat",
+                    }
+                }
+            ]
+        },
+    ).execute()
+
+
+def _append_rows_blocking(creds: Any, sheet_id: str, rows: list[list[Any]]) -> None:
+    """Blocking Sheets append (build + execute). Call via asyncio.to_thread."""
+    global _percent_format_applied
+    from googleapiclient.discovery import (
+        build,
+    )  # optional: pip install google-api-python-client
+
+    service = build("sheets", "v4", credentials=creds)
+    if not _percent_format_applied:
+        _percent_format_applied = True
+        try:
+            _apply_percent_format_blocking(service, sheet_id)
+        except Exception as e:
+            logger.warning("sheets_percent_format_failed", error=str(e))
+    # Append to "Daily Signals" (or first sheet)
+    service.spreadsheets().values().append(
+        spreadsheetId=sheet_id,
+        range=SHEETS_RANGE,
+        valueInputOption="USER_ENTERED",
+        insertDataOption="INSERT_ROWS",
+        body={"values": rows},
+    ).execute()
@@ -25,11 +25,11 @@ def direction_from_edge(
     edge_yes = model_p - market_p_yes. edge_no = market_bid - model_p (for buying NO).
     """
     edge_yes = compute_edge(model_p, market_p_yes)
-    settings = get_settings()
-    if edge_yes >= settings.edge_threshold:
+    threshold = get_settings().edge_threshold
+    if edge_yes >= threshold:
         return "YES", edge_yes
     if market_bid is not None:
         edge_no = round(market_bid - model_p, 4)
-        if edge_no >= settings.edge_threshold:
+        if edge_no >= threshold:
             return "NO", edge_no
     return "NO_TRADE", edge_yes
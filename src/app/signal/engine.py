@@ -9,7 +9,7 @@ from app.fetchers.registry import FeatureSnapshot
 from app.polymarket.models import MarketQuote
 from app.signal.edge import direction_from_edge
 from app.signal.kelly import recommended_size_usd
-from app.signal.reasoning import build_reasoning, missing_sources, reasoning_summary
+from app.signal.reasoning import build_all
 from app.signal.score_to_prob import score_to_model_p
 from app.signal.weights import weighted_score
 from app.logging_config import get_logger
@@ -95,9 +95,7 @@ def run_engine(
         direction, model_p, market_p, bankroll_usd, quote,
         max_bet_usd=max_bet_usd, kelly_fraction_override=kelly_fraction_override,
     )
-    reasoning = build_reasoning(snapshot.results)
-    missing = missing_sources(snapshot.results)
-    summary = reasoning_summary(reasoning, missing_sources_list=missing if missing else None)
+    reasoning, summary, _ = build_all(snapshot.results)
     kelly_used = kelly_fraction_override if kelly_fraction_override is not None else None
     return SignalResult(
         direction=direction,
@@ -113,3 +111,54 @@ def run_engine(
         user_bet_cap_usd=max_bet_usd,
         kelly_fraction_used=kelly_used,
     )
+
+
+def run_engine_batch(
+    snapshot: FeatureSnapshot,
+    quotes: list[MarketQuote],
+    market_slugs: list[str | None] | None = None,
+    market_condition_ids: list[str | None] | None = None,
+    bankroll_usd: float | None = None,
+    weights: dict[str, float] | None = None,
+    max_bet_usd: float | None = None,
+    kelly_fraction_override: float | None = None,
+) -> list[SignalResult]:
+    """
+    Score one snapshot against many market quotes (e.g. the next-N hourly scan).
+    Snapshot-derived work (composite score, Model_P, reasoning) is computed once;
+    only the quote-dependent steps (edge gating, sizing) run per market.
+    Equivalent to calling run_engine once per quote with the same snapshot.
+    """
+    settings = get_settings()
+    bankroll_usd = bankroll_usd or settings.default_bankroll_usd
+    tuples = _results_to_score_tuples(snapshot.results)
+    composite = weighted_score(tuples, weights=weights)
+    model_p = score_to_model_p(composite)
+    reasoning, summary, _ = build_all(snapshot.results)
+    kelly_used = kelly_fraction_override if kelly_fraction_override is not None else None
+    out: list[SignalResult] = []
+    for i, quote in enumerate(quotes):
+        market_p = quote.implied_prob_yes
+        market_bid = getattr(quote, "best_bid", None)
+        direction, edge = direction_from_edge(model_p, market_p, market_bid)
+        recommended_usd, liquidity_warning = _recommended_and_liquidity_warning(
+            direction, model_p, market_p, bankroll_usd, quote,
+            max_bet_usd=max_bet_usd, kelly_fraction_override=kelly_fraction_override,
+        )
+        out.append(
+            SignalResult(
+                direction=direction,
+                model_p=model_p,
+                market_p=market_p,
+                edge=edge,
+                recommended_usd=recommended_usd,
+                reasoning=reasoning,
+                reasoning_summary=summary,
+                liquidity_warning=liquidity_warning,
+                market_slug=market_slugs[i] if market_slugs else None,
+                market_condition_id=market_condition_ids[i] if market_condition_ids else None,
+                user_bet_cap_usd=max_bet_usd,
+                kelly_fraction_used=kelly_used,
+            )
+        )
+    return out
@@ -1,9 +1,11 @@
 """Intraday 15m Up/Down signal engine: TA scoring, time-aware edge, Kelly sizing."""
 
+import time
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import numpy as np
 
 from app.logging_config import get_logger
 from app.polymarket.models import UpDownQuote
@@ -38,8 +40,23 @@ class Signal15mResult:
     liquidity_warning: str | None = None
 
 
-async def fetch_klines_1m(limit: int = 240) -> list[list[float]]:
-    """Fetch 1m klines from Binance. Each row: [open_time, open, high, low, close, volume, ...]."""
+# Candles only change once a minute; a short TTL dedupes bursts of signal
+# ticks (e.g. several users asking within seconds) without serving a stale
+# in-progress last candle for long
+_KLINES_CACHE_TTL = 5.0
+_klines_cache: dict[int, tuple[float, np.ndarray]] = {}
+
+
+async def fetch_klines_1m(limit: int = 240) -> np.ndarray:
+    """
+    Fetch 1m klines from Binance as an (N, 6) float64 array with columns
+    open_time, open, high, low, close, volume. Converting once here keeps the
+    indicator pipeline on contiguous column views instead of per-candle Python
+    lists of boxed floats. Empty (0, 6) array on fetch failure.
+    """
+    cached = _klines_cache.get(limit)
+    if cached is not None and time.monotonic() - cached[0] < _KLINES_CACHE_TTL:
+        return cached[1]
     try:
         async with httpx.AsyncClient(timeout=15.0) as client:
             resp = await client.get(
@@ -50,96 +67,83 @@ async def fetch_klines_1m(limit: int = 240) -> list[list[float]]:
             data = resp.json()
     except Exception as e:
         logger.warning("klines_1m_fetch_failed", error=str(e))
-        return []
+        return np.empty((0, 6))
     if not isinstance(data, list):
-        return []
-    return [c for c in data if isinstance(c, (list, tuple)) and len(c) >= 6]
-
-
-def _typical_price(candle: list) -> float:
-    """(high + low + close) / 3."""
-    return (float(candle[2]) + float(candle[3]) + float(candle[4])) / 3
-
-
-def _session_vwap(candles: list[list[float]]) -> float | None:
-    """Cumulative VWAP: sum(typical * volume) / sum(volume)."""
-    if not candles:
-        return None
-    total_pv = 0.0
-    total_v = 0.0
-    for c in candles:
-        tp = _typical_price(c)
-        vol = float(c[5])
-        total_pv += tp * vol
-        total_v += vol
-    if total_v <= 0:
-        return None
-    return total_pv / total_v
-
-
-def _vwap_series(candles: list[list[float]]) -> list[float]:
-    """Cumulative VWAP at each bar."""
-    out: list[float] = []
-    total_pv = 0.0
-    total_v = 0.0
-    for c in candles:
-        tp = _typical_price(c)
-        vol = float(c[5])
-        total_pv += tp * vol
-        total_v += vol
-        if total_v > 0:
-            out.append(total_pv / total_v)
-        else:
-            out.append(tp)
-    return out
+        return np.empty((0, 6))
+    rows = [c[:6] for c in data if isinstance(c, (list, tuple)) and len(c) >= 6]
+    # Binance returns prices as strings; asarray converts them in C
+    arr = np.asarray(rows, dtype=np.float64) if rows else np.empty((0, 6))
+    if arr.size:
+        _klines_cache[limit] = (time.monotonic(), arr)
+    return arr
+
+
+def _vwap_series(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, vols: np.ndarray
+) -> np.ndarray:
+    """
+    Cumulative VWAP at each bar: cumsum(typical * volume) / cumsum(volume).
+    Bars before any volume has traded fall back to their typical price.
+    """
+    tp = (highs + lows + closes) / 3.0
+    cum_pv = np.cumsum(tp * vols)
+    cum_v = np.cumsum(vols)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vwap = cum_pv / cum_v
+    return np.where(cum_v > 0.0, vwap, tp)
 
 
-def _rsi(closes: list[float], period: int = RSI_PERIOD) -> float | None:
-    """RSI at last bar."""
+def _rsi_series(closes: np.ndarray, period: int = RSI_PERIOD) -> np.ndarray:
+    """
+    RSI at every bar from period+1 onward, in one vectorized pass: a simple
+    rolling average of gains/losses over the last `period` changes, computed via
+    prefix sums of the clipped diffs, so no per-prefix recomputation. Empty when
+    there are not enough closes.
+    """
     if len(closes) < period + 1:
-        return None
-    gains: list[float] = []
-    losses: list[float] = []
-    for i in range(len(closes) - period, len(closes)):
-        ch = closes[i] - closes[i - 1]
-        if ch > 0:
-            gains.append(ch)
-            losses.append(0.0)
-        else:
-            gains.append(0.0)
-            losses.append(-ch)
-    avg_gain = sum(gains) / period if gains else 0.0
-    avg_loss = sum(losses) / period if losses else 0.0
-    if avg_loss == 0:
-        return 100.0
-    rs = avg_gain / avg_loss
-    return 100.0 - (100.0 / (1 + rs))
-
-
-def _rsi_slope(rsi_series: list[float], n: int = 3) -> float | None:
+        return np.empty(0)
+    d = np.diff(closes)
+    cum_gain = np.concatenate(([0.0], np.cumsum(np.clip(d, 0.0, None))))
+    cum_loss = np.concatenate(([0.0], np.cumsum(np.clip(-d, 0.0, None))))
+    avg_gain = (cum_gain[period:] - cum_gain[:-period]) / period
+    avg_loss = (cum_loss[period:] - cum_loss[:-period]) / period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return np.where(avg_loss == 0.0, 100.0, rsi)
+
+
+def _rsi_slope(rsi_series: np.ndarray, n: int = 3) -> float | None:
     """Slope of last n RSI values (linear)."""
     if len(rsi_series) < n:
         return None
     tail = rsi_series[-n:]
-    return (tail[-1] - tail[0]) / n if n else None
+    return float(tail[-1] - tail[0]) / n if n else None
 
 
-def _ema(values: list[float], period: int) -> list[float]:
-    """EMA series; first value is SMA of first period."""
-    if len(values) < period:
-        return []
-    out: list[float] = []
+def _ema(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    EMA series; first value is SMA of first period. The recurrence is inherently
+    sequential, so it stays a loop, but over plain floats into a preallocated
+    array — no list growth and no per-step float boxing.
+    """
+    n = len(values)
+    if n < period:
+        return np.empty(0)
+    out = np.empty(n - period + 1)
     mult = 2.0 / (period + 1)
-    sma = sum(values[:period]) / period
-    out.append(sma)
-    for i in range(period, len(values)):
-        ema_val = (values[i] - out[-1]) * mult + out[-1]
-        out.append(ema_val)
+    # tolist() once: the loop then reads plain floats instead of boxing an
+    # np.float64 per element indexed out of the array
+    vals: list[float] = values.tolist()
+    prev = float(np.mean(values[:period]))
+    out[0] = prev
+    for j, v in enumerate(vals[period:], start=1):
+        prev += (v - prev) * mult
+        out[j] = prev
     return out
 
 
 def _macd(
-    closes: list[float],
+    closes: np.ndarray,
     fast: int = MACD_FAST,
     slow: int = MACD_SLOW,
     signal: int = MACD_SIGNAL,
@@ -153,61 +157,40 @@ def _macd(
     n = len(ema_slow)
     if len(ema_fast) < n:
         return (None, None, None)
-    macd_line = [ema_fast[-n + i] - ema_slow[i] for i in range(n)]
+    macd_line = ema_fast[-n:] - ema_slow
     signal_line = _ema(macd_line, signal)
-    if len(signal_line) < 1:
+    if signal_line.size < 1:
         return (None, None, None)
-    hist = macd_line[-1] - signal_line[-1]
-    return (macd_line[-1], signal_line[-1], hist)
+    hist = float(macd_line[-1]) - float(signal_line[-1])
+    return (float(macd_line[-1]), float(signal_line[-1]), hist)
 
 
-def _heiken_ashi_color(candles: list[list[float]]) -> str | None:
-    """Last bar Heiken Ashi color: 'green' or 'red'."""
-    if len(candles) < 2:
-        return None
-    o0, _, _, c0 = (
-        float(candles[-2][1]),
-        float(candles[-2][2]),
-        float(candles[-2][3]),
-        float(candles[-2][4]),
-    )
-    o1, h1, l1, c1 = (
-        float(candles[-1][1]),
-        float(candles[-1][2]),
-        float(candles[-1][3]),
-        float(candles[-1][4]),
-    )
-    ha_c = (o1 + h1 + l1 + c1) / 4
-    ha_o = (o0 + c0) / 2
-    return "green" if ha_c >= ha_o else "red"
+def _heiken_ashi_greens(
+    opens: np.ndarray, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray
+) -> np.ndarray:
+    """
+    Boolean green/red per HA bar (from the second candle on), vectorized:
+    ha_close = (o+h+l+c)/4 of the bar, ha_open = (o+c)/2 of the previous bar.
+    """
+    if len(opens) < 2:
+        return np.empty(0, dtype=bool)
+    ha_close = (opens[1:] + highs[1:] + lows[1:] + closes[1:]) / 4.0
+    ha_open = (opens[:-1] + closes[:-1]) / 2.0
+    return ha_close >= ha_open
 
 
-def _heiken_ashi_consecutive_count(candles: list[list[float]]) -> int:
-    """Count consecutive same-color HA bars at end."""
-    if len(candles) < 2:
-        return 0
-    colors: list[str] = []
-    for i in range(1, len(candles)):
-        o0, c0 = float(candles[i - 1][1]), float(candles[i - 1][4])
-        o1, h1, l1, c1 = (
-            float(candles[i][1]),
-            float(candles[i][2]),
-            float(candles[i][3]),
-            float(candles[i][4]),
-        )
-        ha_c = (o1 + h1 + l1 + c1) / 4
-        ha_o = (o0 + c0) / 2
-        colors.append("green" if ha_c >= ha_o else "red")
-    if not colors:
+def _trailing_run_length(flags: np.ndarray) -> int:
+    """
+    Length of the trailing run of equal values in a boolean array. argmax on a
+    boolean array short-circuits at the first True, so the common case (trend
+    flipped recently) stops after a few elements instead of scanning the window.
+    """
+    if flags.size == 0:
         return 0
-    last = colors[-1]
-    n = 0
-    for c in reversed(colors):
-        if c == last:
-            n += 1
-        else:
-            break
-    return n
+    mismatch = flags[::-1] != flags[-1]
+    if not mismatch.any():
+        return int(flags.size)
+    return int(np.argmax(mismatch))
 
 
 def _score_direction(
@@ -283,6 +266,15 @@ def _compute_edge_up_down(
     return (round(edge_up, 4), round(edge_down, 4))
 
 
+# (phase, edge threshold, min model prob), indexed by (rem > 5) + (rem > 10):
+# stricter thresholds as less time remains
+_PHASE_TABLE = (
+    ("LATE", 0.20, 0.65),
+    ("MID", 0.10, 0.60),
+    ("EARLY", 0.05, 0.55),
+)
+
+
 def _decide(
     remaining_minutes: float | None,
     edge_up: float | None,
@@ -295,18 +287,7 @@ def _decide(
     Phase = EARLY (>10m), MID (5-10m), LATE (<5m). Stricter thresholds later.
     """
     rem = remaining_minutes if remaining_minutes is not None else 10.0
-    if rem > 10:
-        phase = "EARLY"
-        threshold = 0.05
-        min_prob = 0.55
-    elif rem > 5:
-        phase = "MID"
-        threshold = 0.10
-        min_prob = 0.60
-    else:
-        phase = "LATE"
-        threshold = 0.20
-        min_prob = 0.65
+    phase, threshold, min_prob = _PHASE_TABLE[(rem > 5) + (rem > 10)]
 
     if edge_up is None or edge_down is None:
         return ("NO_TRADE", phase)
@@ -324,11 +305,13 @@ def run_engine_15m(
     quote: UpDownQuote,
     remaining_minutes: float | None,
     bankroll_usd: float,
-    candles_1m: list[list[float]],
+    candles_1m: np.ndarray | list[list[float]],
 ) -> Signal15mResult:
     """
     Compute 15m signal from 1m klines and Up/Down quote.
     Uses TA (VWAP, RSI, MACD, Heiken Ashi) -> raw_up -> time decay -> edge -> decide -> size.
+    candles_1m is the (N, 6) array from fetch_klines_1m; a plain list of
+    candle rows is accepted and converted for convenience.
     """
     reasoning: list[dict[str, Any]] = []
     if len(candles_1m) < RSI_PERIOD + 10:
@@ -347,29 +330,32 @@ def run_engine_15m(
             liquidity_warning=None,
         )
 
-    closes = [float(c[4]) for c in candles_1m]
-    last_price = closes[-1]
-    vwap_now = _session_vwap(candles_1m)
-    vwap_series = _vwap_series(candles_1m)
+    # Every indicator below is array math over column views of one float64 array
+    if isinstance(candles_1m, np.ndarray):
+        arr = candles_1m
+    else:
+        arr = np.asarray([c[:6] for c in candles_1m], dtype=np.float64)
+    opens, highs, lows = arr[:, 1], arr[:, 2], arr[:, 3]
+    closes, vols = arr[:, 4], arr[:, 5]
+    last_price = float(closes[-1])
+    vwap_series = _vwap_series(highs, lows, closes, vols)
+    vwap_now = float(vwap_series[-1]) if float(np.sum(vols)) > 0 else None
     vwap_slope = None
     if len(vwap_series) >= VWAP_SLOPE_LOOKBACK:
-        vwap_slope = (vwap_series[-1] - vwap_series[-VWAP_SLOPE_LOOKBACK]) / VWAP_SLOPE_LOOKBACK
+        vwap_slope = float(vwap_series[-1] - vwap_series[-VWAP_SLOPE_LOOKBACK]) / VWAP_SLOPE_LOOKBACK
 
-    rsi = _rsi(closes, RSI_PERIOD)
-    rsi_series: list[float] = []
-    for i in range(RSI_PERIOD + 1, len(closes) + 1):
-        r = _rsi(closes[:i], RSI_PERIOD)
-        if r is not None:
-            rsi_series.append(r)
-    rsi_slope = _rsi_slope(rsi_series, 3) if rsi_series else None
+    rsi_series = _rsi_series(closes, RSI_PERIOD)
+    rsi = float(rsi_series[-1]) if rsi_series.size else None
+    rsi_slope = _rsi_slope(rsi_series, 3) if rsi_series.size else None
 
     _, _, macd_hist = _macd(closes, MACD_FAST, MACD_SLOW, MACD_SIGNAL)
-    ha_color = _heiken_ashi_color(candles_1m)
-    ha_count = _heiken_ashi_consecutive_count(candles_1m)
+    greens = _heiken_ashi_greens(opens, highs, lows, closes)
+    ha_color = ("green" if greens[-1] else "red") if greens.size else None
+    ha_count = _trailing_run_length(greens)
 
     failed_vwap_reclaim = False
     if vwap_now is not None and len(vwap_series) >= 3:
-        if closes[-1] < vwap_now and closes[-2] > vwap_series[-2]:
+        if last_price < vwap_now and closes[-2] > vwap_series[-2]:
             failed_vwap_reclaim = True
 
     raw_up = _score_direction(
@@ -1,19 +1,31 @@
 """Fractional Kelly sizing with bankroll and liquidity caps."""
 
+import numpy as np
+
 from app.config import get_settings
 
 
 def kelly_fraction(model_p: float, price_yes: float) -> float:
     """
-    Kelly fraction for buying YES at price_yes. p = model_p, q = 1-p, b = (1 - price_yes) / price_yes (net odds).
-    f* = (p*b - q) / b = p - q/b = p - (1-p)*price_yes/(1-price_yes). Cap at 0 if negative.
+    Kelly fraction for buying YES at price_yes. With p = model_p, q = 1-p and net
+    odds b = (1 - price_yes) / price_yes, f* = (p*b - q) / b, which reduces
+    algebraically to (p - price_yes) / (1 - price_yes). Clamped to [0, 1];
+    0 outside the open (0, 1) price domain.
     """
-    if price_yes <= 0 or price_yes >= 1:
+    if price_yes <= 0.0 or price_yes >= 1.0:
         return 0.0
-    q = 1 - model_p
-    b = (1 - price_yes) / price_yes
-    k = (model_p * b - q) / b
-    return max(0.0, min(1.0, k))
+    k = (model_p - price_yes) / (1.0 - price_yes)
+    return 0.0 if k < 0.0 else (1.0 if k > 1.0 else k)
+
+
+def kelly_fraction_vec(model_p: np.ndarray, price_yes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized kelly_fraction over arrays (e.g. a price grid in backtests).
+    Prices outside the open (0, 1) domain yield 0.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = np.clip((model_p - price_yes) / (1.0 - price_yes), 0.0, 1.0)
+    return np.where((price_yes > 0.0) & (price_yes < 1.0), k, 0.0)
 
 
 def recommended_size_usd(
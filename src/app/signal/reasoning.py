@@ -1,5 +1,7 @@
 """Build reasoning payload: factor contributions, raw values, stale/missing."""
 
+import heapq
+from operator import itemgetter
 from typing import Any
 
 from app.fetchers.base import FetcherResult
@@ -38,6 +40,56 @@ def build_reasoning(results: list[FetcherResult]) -> list[dict[str, Any]]:
     return out
 
 
+def build_all(
+    results: list[FetcherResult],
+    weights: dict[str, float] | None = None,
+    max_factors: int = 3,
+) -> tuple[list[dict[str, Any]], str, list[str]]:
+    """
+    build_reasoning + missing_sources + reasoning_summary fused into one pass
+    over results (the standalone helpers make three). Returns
+    (reasoning, summary, missing). heapq picks the strongest/weakest factors
+    in O(N log k) instead of sorting the full contribution list.
+    """
+    w = weights or get_weights()
+    reasoning: list[dict[str, Any]] = []
+    with_contrib: list[tuple[str, float]] = []
+    present: set[str] = set()
+    for r in results:
+        present.add(r.source_id)
+        weight = w.get(r.source_id, 0.0)
+        contrib = (
+            round(r.normalized_score * weight, 4) if r.normalized_score is not None else None
+        )
+        if contrib is not None:
+            with_contrib.append((r.source_id, contrib or 0))
+        reasoning.append(
+            {
+                "factor": r.source_id,
+                "raw_value": r.raw_value,
+                "contribution": contrib,
+                "stale": r.stale,
+                "error": r.error,
+            }
+        )
+    missing = [sid for sid in w if sid not in present]
+    top = heapq.nlargest(max_factors, with_contrib, key=itemgetter(1))
+    bot = (
+        heapq.nsmallest(max_factors, with_contrib, key=itemgetter(1))[::-1]
+        if len(with_contrib) > max_factors
+        else []
+    )
+    parts = []
+    if top:
+        parts.append("Strong: " + ", ".join(f"{f}({c:+.2f})" for f, c in top))
+    if bot and bot != top:
+        parts.append("Weak: " + ", ".join(f"{f}({c:+.2f})" for f, c in bot))
+    if missing:
+        parts.append("Missing: " + ", ".join(missing))
+    summary = "; ".join(parts) if parts else "No factors"
+    return reasoning, summary, missing
+
+
 def reasoning_summary(
     reasoning: list[dict[str, Any]],
     missing_sources_list: list[str] | None = None,
@@ -8,11 +8,23 @@ Formula (linear): Model_P = 0.15 + (score + 2) / 4 * 0.70
 Bounds avoid extremes; configurable via constants if needed.
 """
 
+import numpy as np
+
+_P_MIN = 0.15
+_P_MAX = 0.85
+# (P_MAX - P_MIN) / score span of 4: one fused multiply-add per call
+_SLOPE = (_P_MAX - _P_MIN) / 4.0
+
 
 def score_to_model_p(score: float) -> float:
     """Linear map: score in [-2, +2] -> Model_P in [0.15, 0.85]. Clamp at boundaries."""
     if score <= -2:
-        return 0.15
+        return _P_MIN
     if score >= 2:
-        return 0.85
-    return round(0.15 + (score + 2) / 4 * 0.70, 4)
+        return _P_MAX
+    return round(_P_MIN + (score + 2) * _SLOPE, 4)
+
+
+def score_to_model_p_vec(scores: np.ndarray) -> np.ndarray:
+    """Vectorized score_to_model_p over an array of scores (e.g. backtest sweeps)."""
+    return np.round(np.clip(_P_MIN + (scores + 2.0) * _SLOPE, _P_MIN, _P_MAX), 4)
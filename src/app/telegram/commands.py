@@ -32,7 +32,7 @@ from app.polymarket.selection_15m import (
     build_updown_quote,
     select_btc_15m_updown_market,
 )
-from app.signal.engine import run_engine
+from app.signal.engine import run_engine, run_engine_batch
 from app.signal.engine_15m import Signal15mResult, fetch_klines_1m, run_engine_15m
 from app.signal.reasoning import missing_sources as get_missing_sources
 from app.signal.weights import get_weights
@@ -172,6 +172,8 @@ async def handle_signal(token: str, chat_id: int, user_id: int) -> None:
         slug=market.slug,
         resolution_source=market.resolution_source,
         end_date=market.end_date,
+        question=market.question,
+        outcomes_json=market.outcomes_raw,
     )
 
     quote = MarketQuote(
@@ -256,7 +258,7 @@ async def handle_signal_hourly5(token: str, chat_id: int, user_id: int) -> None:
     kelly_override = prefs.get("kelly_fraction_override") if prefs else None
 
     snapshot, weights = await run_fetchers_for_market(markets[0])
-    markets_results: list[tuple[Market, SignalResult]] = []
+    quotes: list[MarketQuote] = []
 
     for market in markets:
         best_bid = market.best_bid
@@ -273,24 +275,28 @@ async def handle_signal_hourly5(token: str, chat_id: int, user_id: int) -> None:
         spread = (best_ask - best_bid) if (best_bid is not None and best_ask is not None) else 0.0
         best_ask_val = best_ask if best_ask is not None else 0.5
         max_safe = max_safe_size_usd(book, side="ask") if book else 0.0
-        quote = MarketQuote(
-            best_bid=best_bid or 0.0,
-            best_ask=best_ask_val,
-            spread=spread,
-            implied_prob_yes=best_ask_val,
-            max_safe_size_usd=max_safe,
-        )
-        result = run_engine(
-            snapshot,
-            quote,
-            market_slug=market.slug,
-            market_condition_id=market.condition_id,
-            bankroll_usd=bankroll,
-            weights=weights,
-            max_bet_usd=max_bet,
-            kelly_fraction_override=kelly_override,
+        quotes.append(
+            MarketQuote(
+                best_bid=best_bid or 0.0,
+                best_ask=best_ask_val,
+                spread=spread,
+                implied_prob_yes=best_ask_val,
+                max_safe_size_usd=max_safe,
+            )
         )
-        markets_results.append((market, result))
+
+    # One snapshot feeds all markets, so score it once and gate/size per quote
+    results = run_engine_batch(
+        snapshot,
+        quotes,
+        market_slugs=[m.slug for m in markets],
+        market_condition_ids=[m.condition_id for m in markets],
+        bankroll_usd=bankroll,
+        weights=weights,
+        max_bet_usd=max_bet,
+        kelly_fraction_override=kelly_override,
+    )
+    markets_results: list[tuple[Market, SignalResult]] = list(zip(markets, results))
 
     missing_list = get_missing_sources(snapshot.results)
     msg = format_signal_multi_hour(markets_results, missing_sources=missing_list or None)
@@ -411,11 +417,14 @@ async def handle_signal_15m(token: str, chat_id: int, user_id: int) -> None:
 
     from app.db.market_metadata import upsert_market_metadata
 
+    raw_outcomes = market.raw.get("outcomes")
     await upsert_market_metadata(
         condition_id=market.condition_id,
         slug=market.slug,
         resolution_source=market.resolution_source,
         end_date=market.end_date,
+        question=market.question,
+        outcomes_json=raw_outcomes if isinstance(raw_outcomes, str) else None,
     )
 
     msg = format_signal_15m_summary(result_15m, market_slug=market.slug)
@@ -784,6 +793,8 @@ async def run_daily_signal_broadcast() -> dict[str, Any]:
         slug=market.slug,
         resolution_source=market.resolution_source,
         end_date=market.end_date,
+        question=market.question,
+        outcomes_json=market.outcomes_raw,
     )
     quote = MarketQuote(
         best_bid=best_bid or 0.0,
@@ -34,7 +34,7 @@ async def test_run_all_fetchers_returns_snapshot() -> None:
 
 
 def test_feature_snapshot_to_rows() -> None:
-    """to_rows produces list of dicts for DB."""
+    """to_rows produces tuples for executemany; to_dict_rows keeps dicts for API."""
     snapshot = FeatureSnapshot(
         results=[
             FetcherResult("a", "1", 0.5, False),
@@ -44,10 +44,13 @@ def test_feature_snapshot_to_rows() -> None:
     )
     rows = snapshot.to_rows()
     assert len(rows) == 2
-    assert rows[0]["source_id"] == "a"
-    assert rows[0]["raw_value"] == "1"
-    assert rows[0]["normalized_score"] == 0.5
-    assert rows[1]["stale"] is True
+    assert rows[0] == ("a", "1", 0.5, False)
+    assert rows[1] == ("b", "2", None, True)
+    dict_rows = snapshot.to_dict_rows()
+    assert dict_rows[0]["source_id"] == "a"
+    assert dict_rows[0]["raw_value"] == "1"
+    assert dict_rows[0]["normalized_score"] == 0.5
+    assert dict_rows[1]["stale"] is True
 
 
 # --- normalize() unit tests ---
@@ -6,6 +6,7 @@ import httpx
 import pytest
 import respx
 
+from app.outcomes import resolution
 from app.outcomes.resolution import (
     is_binance_resolution,
     is_up_down_market,
@@ -15,6 +16,12 @@ from app.outcomes.resolution import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_kline_cache() -> None:
+    """Klines are TTL-cached per (symbol, interval, start); isolate tests."""
+    resolution._kline_cache.clear()
+
+
 def test_parse_rule_above() -> None:
     """Parse 'above $96,500' from question/slug."""
     rule_above, rule_below = parse_rule_from_question("Bitcoin above $96,500 on January 30?")
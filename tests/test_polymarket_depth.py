@@ -1,7 +1,7 @@
 """Phase 2: order book parsing (CLOB response) and max_safe_size_usd."""
 
 import pytest
-from app.polymarket.client import parse_order_book, parse_market
+from app.polymarket.client import parse_market, parse_order_book
 from app.polymarket.depth import max_safe_size_usd
 from app.polymarket.models import OrderBook, OrderBookLevel
 
@@ -66,6 +66,16 @@ def test_max_safe_size_usd_asks() -> None:
     assert size == 60.0
 
 
+def test_max_safe_size_usd_deep_book() -> None:
+    """Deep book takes the vectorized path; same cut-off semantics as the level walk."""
+    asks = [OrderBookLevel(price=0.60 + 0.001 * i, size=50) for i in range(20)]
+    book = OrderBook(bids=[], asks=asks, best_bid=None, best_ask=0.60)
+    # Average price stays within 1% of 0.60 through the first 12 levels
+    # (level 13 lands exactly on the limit, which float rounding tips over):
+    # 50 * (12 * 0.60 + 0.001 * (0 + ... + 11)) = 363.30 USD
+    assert max_safe_size_usd(book, side="ask") == 363.30
+
+
 def test_max_safe_size_usd_empty_book() -> None:
     """Empty book returns 0."""
     book = OrderBook(bids=[], asks=[], best_bid=None, best_ask=None)
@@ -191,6 +191,37 @@ async def test_select_btc_market_prefers_hourly_then_daily() -> None:
     assert "up-or-down" in (market.slug or "")
 
 
+@pytest.mark.asyncio
+async def test_select_btc_up_down_hourly_market_default_now_is_cached() -> None:
+    """Repeat calls without now_utc within the TTL share one Gamma fetch."""
+    from app.polymarket import selection
+
+    raw_markets = [
+        {
+            "id": "1",
+            "conditionId": "0xa",
+            "slug": "bitcoin-up-or-down-january-31-2pm-et",
+            "endDate": "2099-01-31T20:00:00Z",
+            "eventStartTime": "2020-01-31T19:00:00Z",
+            "outcomes": '["Up", "Down"]',
+            "active": True,
+            "closed": False,
+            "enableOrderBook": True,
+        },
+    ]
+    selection._select_cache.clear()
+    try:
+        with patch("app.polymarket.selection.fetch_markets", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = raw_markets
+            first = await select_btc_up_down_hourly_market()
+            second = await select_btc_up_down_hourly_market()
+        assert first is not None
+        assert second is first
+        assert mock_fetch.await_count == 1
+    finally:
+        selection._select_cache.clear()
+
+
 def test_is_btc_up_down_hourly_market() -> None:
     """is_btc_up_down_hourly_market True for Up/Down slug."""
     from app.polymarket.models import Market